@@ -6,85 +6,236 @@ Supports both Jira Cloud and On-Premise installations.
 Generated: 2025-10-19
 """
 
+import importlib.util
+import logging
 import streamlit as st
-from atlassian import Jira
 from io import BytesIO
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
-#from jira_core import PERSONA_PROMPTS
 
 from jira_core import (
-    JiraClient, 
-    JQLBuilder, 
-    get_next_period_dates, 
     build_jql, 
-    fetch_issues,
+    get_next_period_dates,
+    fetch_issues_parallel,
+    ISSUE_FIELDS,
+    NEXT_STEP_FIELDS,
+    discover_projects,
     generate_report,
     PERSONA_PROMPTS
 )
-from auth import load_secure_credentials, validate_credentials
+from auth import load_secure_credentials, validate_credentials, get_jira_client
 from llm_integrations import fetch_groq_models
 from storage import save_criteria, load_criteria, get_all_presets, delete_preset
 
-# Optional PDF support
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-
-# Optional Excel support
-try:
-    import openpyxl
-    EXCEL_AVAILABLE = True
-except ImportError:
-    EXCEL_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+# Optional PDF / Excel support - detected at startup, imported on first export
+PDF_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+
+# xlsxwriter preferred for value-only sheets, openpyxl as fallback
+if importlib.util.find_spec('xlsxwriter') is not None:
+    EXCEL_ENGINE = 'xlsxwriter'
+elif importlib.util.find_spec('openpyxl') is not None:
+    EXCEL_ENGINE = 'openpyxl'
+else:
+    EXCEL_ENGINE = None
+EXCEL_AVAILABLE = EXCEL_ENGINE is not None
+
+
+# Persona labels shown in the UI and their prompt keys, derived once at import
+PERSONA_OPTIONS = ["Team Lead", "manager", "cto", "group_manager"]
+_PERSONA_KEY = {p: p.lower().replace(' ', '_') for p in PERSONA_OPTIONS}
+
+# Widget keys saved in a preset, with the value used when a widget is unset
+PRESET_KEYS = {
+    'initiative_name': '',
+    'url': '',
+    'spaces': '',
+    'labels': '',
+    'llm_provider': 'None',
+    'persona': 'Team Lead',
+    'period': 'last_week'
+}
 
 
 # ============================================================================
 # EXPORT FUNCTIONS
 # ============================================================================
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
 def export_to_pdf(report_text, initiative_name):
-    """Export report to PDF with formatting"""
+    """Export report to PDF with formatting, returned as bytes (cached per input)"""
     if not PDF_AVAILABLE:
         raise ImportError("reportlab not installed. Run: pip install reportlab")
     
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfgen import canvas
+    
+    width, height = letter
+    margin = 72
+    font, size, leading = 'Helvetica', 10, 14
+    max_width = width - 2 * margin
+    
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
+    # Draw straight onto the canvas: text is plain strings (no markup
+    # parsing, so '<' and '&' in tickets are safe) and only the current
+    # page is held in memory
+    c = canvas.Canvas(buffer, pagesize=letter)
+    c.setTitle(f"{initiative_name} - Status Report")
+    c.setFont('Helvetica-Bold', 16)
+    c.drawCentredString(width / 2, height - margin, f"{initiative_name} - Status Report")
+    
+    # One text object per page: lines are emitted inside a single BT/ET
+    # block instead of one block (and font setup) per drawString
+    y = height - margin - 30
+    text = c.beginText(margin, y)
+    text.setFont(font, size, leading)
+    for line in report_text.strip('\n').split('\n'):
+        # Word-wrap to the page width; blank lines keep their spacing
+        for segment in simpleSplit(line, font, size, max_width) or ['']:
+            if y < margin:
+                c.drawText(text)
+                c.showPage()
+                y = height - margin
+                text = c.beginText(margin, y)
+                text.setFont(font, size, leading)
+            text.textLine(segment)
+            y -= leading
+    c.drawText(text)
     
-    story.append(Paragraph(f"<b>{initiative_name} - Status Report</b>", styles['Title']))
-    story.append(Spacer(1, 12))
+    c.save()
+    return buffer.getvalue()
+
+
+def _excel_value(value):
+    """Flatten a list/dict cell (e.g. Subtasks) into text"""
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(v) for v in value)
+    return str(value)
+
+
+def _excel_rows(frame):
+    """
+    Row tuples holding only values the Excel writers accept.
+
+    Missing values are blanked in one vectorized pass; only columns that
+    hold containers are converted cell by cell.
+    """
+    frame = frame.astype(object).where(frame.notna(), None)
+    for col in frame.columns:
+        first = frame[col].first_valid_index()
+        if first is not None and isinstance(frame[col].at[first], (list, tuple, dict)):
+            frame[col] = frame[col].map(_excel_value, na_action='ignore')
+    return frame.itertuples(index=False, name=None)
+
+
+def _write_xlsxwriter(buffer, sheets):
+    """Write sheets with xlsxwriter, flushing each row as it is written"""
+    import xlsxwriter
     
-    for line in report_text.split('\n'):
-        if line.strip():
-            story.append(Paragraph(line, styles['Normal']))
-            story.append(Spacer(1, 6))
+    wb = xlsxwriter.Workbook(buffer, {'constant_memory': True, 'strings_to_urls': False})
+    for sheet_name, header, rows in sheets:
+        ws = wb.add_worksheet(sheet_name)
+        ws.write_row(0, 0, header)
+        for row_idx, row in enumerate(rows, start=1):
+            ws.write_row(row_idx, 0, row)
+    wb.close()
+
+
+def _write_openpyxl(buffer, sheets):
+    """Write sheets with a write-only openpyxl workbook"""
+    import openpyxl
     
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+    wb = openpyxl.Workbook(write_only=True)
+    for sheet_name, header, rows in sheets:
+        ws = wb.create_sheet(sheet_name)
+        ws.append(header)
+        for row in rows:
+            ws.append(row)
+    wb.save(buffer)
 
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
 def export_to_excel(df, next_df, report_text):
-    """Export to Excel with multiple sheets"""
+    """
+    Export to Excel with multiple sheets.
+
+    Streams rows straight into the workbook instead of going through
+    pd.ExcelWriter, so memory stays flat and no per-cell styles are built.
+    Uses xlsxwriter when installed, otherwise openpyxl. Returns the
+    workbook as bytes, ready for st.download_button; cached per input so
+    reruns skip serialization.
+    """
     if not EXCEL_AVAILABLE:
-        raise ImportError("openpyxl not installed. Run: pip install openpyxl")
+        raise ImportError("No Excel engine installed. Run: pip install xlsxwriter")
     
-    buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Current Issues', index=False)
-        next_df.to_excel(writer, sheet_name='Next Steps', index=False)
-        
-        context_df = pd.DataFrame({'Report': [report_text]})
-        context_df.to_excel(writer, sheet_name='Full Report', index=False)
+    sheets = [
+        ('Current Issues', list(df.columns), _excel_rows(df)),
+        ('Next Steps', list(next_df.columns), _excel_rows(next_df)),
+        ('Full Report', ['Report'], [(report_text,)])
+    ]
     
-    buffer.seek(0)
-    return buffer
+    buffer = BytesIO()
+    if EXCEL_ENGINE == 'xlsxwriter':
+        _write_xlsxwriter(buffer, sheets)
+    else:
+        _write_openpyxl(buffer, sheets)
+    return buffer.getvalue()
+
+
+def _deferred_export(label, export, *args):
+    """
+    Download-button callable that runs `export(*args)` on click.
+
+    Streamlit runs deferred downloads outside the script run, where st.error
+    cannot render and a failure only reaches the browser as a generic
+    download error. Failures are logged, recorded in the session's
+    export_errors dict (shown on the next rerun) and re-raised so no broken
+    file is served.
+    """
+    errors = st.session_state.setdefault('export_errors', {})
+
+    def run():
+        try:
+            return export(*args)
+        except Exception as e:
+            logger.exception("%s export failed", label)
+            errors[label] = str(e)
+            raise
+    return run
+
+
+# ============================================================================
+# JIRA DATA CACHE
+# ============================================================================
+
+@st.cache_data(ttl=600, show_spinner=False, max_entries=16)
+def _discover_projects(url, email, jira_token, is_cloud, verify_ssl):
+    """Project discovery per Jira account, reused for 10 minutes across clicks"""
+    jira = get_jira_client(url, email, jira_token, is_cloud, verify_ssl)
+    return discover_projects(jira, is_cloud)
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=32)
+def _fetch_report_issues(url, email, jira_token, is_cloud, verify_ssl, jql, fields=ISSUE_FIELDS):
+    """
+    Report issues per Jira account and JQL, reused for 5 minutes.
+
+    Regenerating with another persona or LLM skips the paginated download.
+    Relative periods embed today's date in the JQL, so entries roll daily.
+    """
+    jira = get_jira_client(url, email, jira_token, is_cloud, verify_ssl)
+    return fetch_issues_parallel(jira, jql, fields=fields)
+
+
+def _warm_jira_client(url, email, jira_token):
+    """Background login for the default config - failures surface on Generate"""
+    try:
+        get_jira_client(url, email, jira_token, True, True)
+    except Exception:
+        pass
 
 
 # ============================================================================
@@ -128,7 +279,18 @@ if not creds_valid:
     st.info("💡 **Quick Fix**: Check your `.streamlit/secrets.toml` file and ensure field names match exactly.")
     st.stop()
 
-# Sidebar presets
+# Log in to the default Jira in the background once per session, overlapping
+# the Groq model fetch and form filling; Generate then hits the cached client
+if not st.session_state.get('jira_warmed'):
+    st.session_state['jira_warmed'] = True
+    _warm_pool = ThreadPoolExecutor(max_workers=1)
+    _warm_pool.submit(
+        _warm_jira_client,
+        CREDENTIALS['jira_url'], CREDENTIALS['jira_email'], CREDENTIALS['jira_token']
+    )
+    _warm_pool.shutdown(wait=False)
+
+# Sidebar presets (storage caches the parsed file until it changes on disk)
 st.sidebar.markdown("### 💾 PRESETS")
 presets = get_all_presets()
 selected_preset = st.sidebar.selectbox("Load Preset", ["None"] + presets)
@@ -138,23 +300,23 @@ with col1:
     preset_name = st.text_input("Save As", key="save_name")
 with col2:
     if st.button("💾 Save"):
-        criteria = {
-            'initiative_name': st.session_state.get('initiative_name', ''),
-            'url': st.session_state.get('url', ''),
-            'spaces': st.session_state.get('spaces', ''),
-            'labels': st.session_state.get('labels', ''),
-            'llm_provider': st.session_state.get('llm_provider', 'None'),
-            'persona': st.session_state.get('persona', 'Team Lead'),
-            'period': st.session_state.get('period', 'last_week')
-        }
+        ss = st.session_state
+        criteria = {k: ss.get(k, default) for k, default in PRESET_KEYS.items()}
         save_criteria(preset_name, criteria)
 
 if st.sidebar.button("🗑 Delete Preset") and selected_preset != "None":
     delete_preset(selected_preset)
 
+# Cached Jira connections are reused across reruns; allow a manual reset.
+# Handled once the connection details below are known.
+reconnect_jira = st.sidebar.button("🔄 Reconnect to Jira", help="Drop cached Jira connections and data, then log in again")
+
 # Load preset
-if selected_preset != "None":
-    criteria = load_criteria(selected_preset)
+# Apply a preset once when it is picked, not on every rerun - re-applying
+# would also overwrite any edits made after loading it
+if selected_preset != st.session_state.get('applied_preset'):
+    st.session_state['applied_preset'] = selected_preset
+    criteria = load_criteria(selected_preset) if selected_preset != "None" else None
     if criteria:
         for k, v in criteria.items():
             st.session_state[k] = v
@@ -233,47 +395,11 @@ if not use_default_jira:
         if st.button("🔍 Discover Projects"):
             try:
                 with st.spinner("Fetching projects..."):
-                    temp_jira = Jira(
-                        url=url, 
-                        username=email, 
-                        password=jira_token, 
-                        cloud=is_cloud,
-                        verify_ssl=verify_ssl
-                    )
-                    
-                    # Try API v3 first (Cloud/newer on-prem)
-                    try:
-                        response = temp_jira.get('rest/api/3/project/search')
-                        projects = response.get('values', [])
-                        if projects:
-                            project_info = {p['key']: p.get('name', 'Unknown') for p in projects}
-                            st.session_state['available_projects'] = list(project_info.keys())
-                            st.session_state['project_names'] = project_info
-                            st.success(f"✅ Found {len(projects)} projects (API v3)")
-                    except:
-                        # Fallback to API v2 (older on-prem)
-                        try:
-                            response = temp_jira.get('rest/api/2/project')
-                            if isinstance(response, list):
-                                project_info = {p['key']: p.get('name', 'Unknown') for p in response}
-                                st.session_state['available_projects'] = list(project_info.keys())
-                                st.session_state['project_names'] = project_info
-                                st.success(f"✅ Found {len(response)} projects (API v2)")
-                        except:
-                            # Fallback to JQL method
-                            result = temp_jira.jql('assignee = currentUser() OR reporter = currentUser()', limit=100)
-                            issues = result.get('issues', [])
-                            unique_projects = {}
-                            for issue in issues:
-                                proj = issue.get('fields', {}).get('project', {})
-                                if proj:
-                                    key = proj.get('key')
-                                    name = proj.get('name', 'Unknown')
-                                    unique_projects[key] = name
-                            if unique_projects:
-                                st.session_state['available_projects'] = list(unique_projects.keys())
-                                st.session_state['project_names'] = unique_projects
-                                st.success(f"✅ Found {len(unique_projects)} projects (from your issues)")
+                    project_info, source = _discover_projects(url, email, jira_token, is_cloud, verify_ssl)
+                    if project_info:
+                        st.session_state['available_projects'] = list(project_info.keys())
+                        st.session_state['project_names'] = project_info
+                        st.success(f"✅ Found {len(project_info)} projects ({source})")
             except Exception as e:
                 st.error(f"❌ Failed to fetch projects: {e}")
         
@@ -307,12 +433,22 @@ else:
     # Default project space
     spaces = st.text_input("Jira Spaces*", value="AWS", key="spaces")
 
+# Reconnect drops only this user's cached client, projects and issues;
+# other sessions sharing the process keep theirs
+if reconnect_jira:
+    connection = (url, email, jira_token, is_cloud, verify_ssl)
+    get_jira_client.clear(*connection)
+    _discover_projects.clear(*connection)
+    for fetch_args in st.session_state.pop('issue_cache_keys', []):
+        _fetch_report_issues.clear(*fetch_args)
+
 # Common inputs (always shown)
 labels = st.text_input("Labels (optional)", key="labels")
 #persona = st.selectbox("Persona", ["Team Lead", "Manager", "Group Manager", "CTO"], key="persona")
 st.header("👤 PERSONA")
-persona = st.selectbox("Persona", ["Team Lead", "manager", "cto", "group_manager"], key="persona")
-persona_prompt = st.text_area("Persona Prompt (Try editing this!)", value=PERSONA_PROMPTS.get(persona, PERSONA_PROMPTS["team_lead"]), key="persona_prompt")
+persona = st.selectbox("Persona", PERSONA_OPTIONS, key="persona")
+persona_key = _PERSONA_KEY[persona]  # Reused by report + judge
+persona_prompt = st.text_area("Persona Prompt (Try editing this!)", value=PERSONA_PROMPTS.get(persona_key, PERSONA_PROMPTS["team_lead"]), key="persona_prompt")
 # ============================================================================
 # LLM PROVIDER SELECTION
 # ============================================================================
@@ -326,6 +462,10 @@ llm_provider = st.selectbox(
 llm_key = None
 selected_groq_model = None
 
+# Groq model list and default, shared by the report and judge selectors
+groq_models = None
+groq_default_index = 0
+
 if llm_provider == "Groq (Free Tier)":
     if not CREDENTIALS.get('groq_api_key'):
         st.error("⚠️ Groq API key not configured. Please set up secrets.")
@@ -333,21 +473,20 @@ if llm_provider == "Groq (Free Tier)":
     else:
         # Fetch available models dynamically
         with st.spinner("Loading models..."):
-            available_models = fetch_groq_models(CREDENTIALS['groq_api_key'])
+            groq_models = fetch_groq_models(CREDENTIALS['groq_api_key'])
         
-        if not available_models:
+        if not groq_models:
             st.error("❌ Could not fetch Groq models. Check configuration.")
             st.stop()
         
         # Set default to kimi-k2-instruct if available
-        default_index = 0
-        if "moonshot-ai/kimi-k2-instruct" in available_models:
-            default_index = available_models.index("moonshot-ai/kimi-k2-instruct")
+        if "moonshot-ai/kimi-k2-instruct" in groq_models:
+            groq_default_index = groq_models.index("moonshot-ai/kimi-k2-instruct")
         
         selected_groq_model = st.selectbox(
             "Select Model",
-            available_models,
-            index=default_index,
+            groq_models,
+            index=groq_default_index,
             help="If you encounter rate limits, select a different model."
         )
         
@@ -408,20 +547,20 @@ with st.expander("⚙️ Configure AI Judge & Auto-Validation", expanded=False):
             if not CREDENTIALS.get('groq_api_key'):
                 st.error("⚠️ Groq API key not configured for judge.")
             else:
-                with st.spinner("Loading judge models..."):
-                    judge_models = fetch_groq_models(CREDENTIALS['groq_api_key'])
+                # Reuse the report selector's list when it was already fetched
+                if groq_models is None:
+                    with st.spinner("Loading judge models..."):
+                        groq_models = fetch_groq_models(CREDENTIALS['groq_api_key'])
+                    if "moonshot-ai/kimi-k2-instruct" in groq_models:
+                        groq_default_index = groq_models.index("moonshot-ai/kimi-k2-instruct")
                 
-                if not judge_models:
+                if not groq_models:
                     st.error("❌ Could not fetch Groq models for judge.")
                 else:
-                    default_index = 0
-                    if "moonshot-ai/kimi-k2-instruct" in judge_models:
-                        default_index = judge_models.index("moonshot-ai/kimi-k2-instruct")
-                    
                     selected_judge_groq_model = st.selectbox(
                         "Judge Model",
-                        judge_models,
-                        index=default_index,
+                        groq_models,
+                        index=groq_default_index,
                         key="judge_groq_model",
                         help="Model for validation (can differ from report generation model)"
                     )
@@ -441,7 +580,6 @@ with st.expander("⚙️ Configure AI Judge & Auto-Validation", expanded=False):
         st.markdown("*Customize how the AI judge validates summaries. The judge will check for completeness, accuracy, and grounding in actual ticket data.*")
         
         # Get default judge prompt based on persona
-        persona_key = persona.lower().replace(' ', '_')
         default_judge_prompt = AI_JUDGE_PROMPTS.get(persona_key, AI_JUDGE_PROMPTS.get('team_lead', ''))
         
         judge_prompt_template = st.text_area(
@@ -454,13 +592,17 @@ with st.expander("⚙️ Configure AI Judge & Auto-Validation", expanded=False):
         
         # Store derived values (widgets with keys are auto-stored by Streamlit)
         # Only store judge_llm_key since it's conditionally derived from CREDENTIALS or text input
-        if 'judge_llm_key_value' not in st.session_state or st.session_state.get('judge_llm_key_value') != judge_llm_key:
-            st.session_state['judge_llm_key_value'] = judge_llm_key
+        st.session_state['judge_llm_key_value'] = judge_llm_key
 
 # ============================================================================
 # GENERATE REPORT
 # ============================================================================
 
+force_refresh = st.checkbox(
+    "🔁 Force refresh from Jira",
+    help="Ignore cached issues and AI summaries; fetch and summarize again"
+)
+
 if st.button("📄 Generate Report"):
     if not all([initiative_name, url, email, jira_token, spaces]):
         st.error("❌ Please fill all required fields")
@@ -468,34 +610,36 @@ if st.button("📄 Generate Report"):
         try:
             # Authentication
             with st.spinner("Connecting to Jira..."):
-                jira_client = Jira(
-                    url=url, 
-                    username=email, 
-                    password=jira_token, 
-                    cloud=is_cloud,
-                    verify_ssl=verify_ssl
-                )
-                
                 try:
-                    myself = jira_client.myself()
+                    jira_client = get_jira_client(url, email, jira_token, is_cloud, verify_ssl)
                 except Exception as auth_error:
                     st.error(f"❌ Authentication failed: {auth_error}")
                     if not is_cloud:
                         st.info("💡 On-Premise troubleshooting:\n- Verify username (not email)\n- Check if PAT is enabled\n- Confirm VPN/network access")
                     st.stop()
             
-            # Fetch issues with resolution date filter
+            # Fetch this period's resolved issues and next period's due issues together
             with st.spinner("Fetching data..."):
                 jql = build_jql(spaces, labels, period, time_field='resolutiondate')
-                issues = fetch_issues(jira_client, jql, debug=False)
+                next_jql = build_jql(spaces, labels, get_next_period_dates(period), time_field='duedate')
+                fetch = partial(_fetch_report_issues, url, email, jira_token, is_cloud, verify_ssl)
+                # Remember this session's cache entries so Reconnect can drop just them
+                cache_keys = st.session_state.setdefault('issue_cache_keys', [])
+                for fetch_args in (fetch.args + (jql,), fetch.args + (next_jql, NEXT_STEP_FIELDS)):
+                    if force_refresh:
+                        # Evict only the entries for the queries being refreshed
+                        _fetch_report_issues.clear(*fetch_args)
+                    if fetch_args not in cache_keys:
+                        cache_keys.append(fetch_args)
+                with ThreadPoolExecutor(max_workers=2) as fetch_pool:
+                    next_fetch = fetch_pool.submit(fetch, next_jql, NEXT_STEP_FIELDS)
+                    issues = fetch_pool.submit(fetch, jql).result()
+                    next_issues = next_fetch.result()
                 
                 if not issues:
                     st.warning("⚠️ No issues found matching your criteria")
                     st.stop()
             
-            # Store raw issues for judge
-            st.session_state['raw_issues'] = issues
-            
             # Check if AI Judge is enabled
             enable_judge = st.session_state.get('enable_judge', False)
             
@@ -507,7 +651,7 @@ if st.button("📄 Generate Report"):
                 with st.spinner("🔄 Generating report with AI Judge validation..."):
                     report, df, next_df, judge_evaluation, validation_passed = generate_report_with_validation(
                         issues,
-                        persona.lower().replace(' ', '_'),
+                        persona_key,
                         llm_provider,
                         llm_key,
                         initiative_name,
@@ -521,7 +665,9 @@ if st.button("📄 Generate Report"):
                         judge_model=st.session_state.get('judge_groq_model'),
                         groq_model=selected_groq_model,
                         persona_prompt=persona_prompt,
-                        judge_prompt_template=st.session_state.get('judge_prompt_template')
+                        judge_prompt_template=st.session_state.get('judge_prompt_template'),
+                        next_issues=next_issues,
+                        refresh_summary=force_refresh
                     )
                     
                     # Store results
@@ -547,10 +693,13 @@ if st.button("📄 Generate Report"):
                             st.warning(f"⚠️ Trustworthiness Score: {validation_result['trustworthiness_score']}/10")
             else:
                 # Regular generation without judge
+                # Stream the AI summary into a placeholder while the report is
+                # built, then clear it: the finished report below contains it
+                summary_placeholder = st.empty()
                 with st.spinner("Generating report..."):
                     report, df, next_df = generate_report(
                         issues, 
-                        persona.lower().replace(' ', '_'), 
+                        persona_key, 
                         llm_provider, 
                         llm_key, 
                         initiative_name, 
@@ -559,7 +708,10 @@ if st.button("📄 Generate Report"):
                         spaces, 
                         labels,
                         groq_model=selected_groq_model,
-                        persona_prompt=persona_prompt
+                        persona_prompt=persona_prompt,
+                        summary_writer=summary_placeholder.write_stream,
+                        next_issues=next_issues,
+                        refresh_summary=force_refresh
                     )
                     
                     # Store in session state
@@ -567,6 +719,7 @@ if st.button("📄 Generate Report"):
                     st.session_state['generated_df'] = df
                     st.session_state['generated_next_df'] = next_df
                     st.session_state['generated_initiative_name'] = initiative_name
+                summary_placeholder.empty()
             
             # Check for rate limit warning in report
             if "⚠️ Rate limit hit" in report:
@@ -635,41 +788,42 @@ if 'generated_report' in st.session_state and st.session_state.generated_report:
     st.markdown("---")
     st.subheader("📥 Export Options")
     
-    # Export buttons
+    # Report failures from earlier download clicks
+    for label, message in st.session_state.pop('export_errors', {}).items():
+        st.error(f"{label} export failed: {message}")
+    
+    # Exports are built only when a download button is clicked: each button
+    # gets a callable that Streamlit runs on click (cached per report)
     col1, col2 = st.columns(2)
     with col1:
         if PDF_AVAILABLE:
-            try:
-                pdf_buffer = export_to_pdf(
-                    st.session_state.generated_report, 
+            st.download_button(
+                "📥 Download PDF",
+                _deferred_export(
+                    "PDF",
+                    export_to_pdf,
+                    st.session_state.generated_report,
                     st.session_state.generated_initiative_name
-                )
-                st.download_button(
-                    "📥 Download PDF",
-                    pdf_buffer,
-                    file_name=f"{st.session_state.generated_initiative_name}_report.pdf",
-                    mime="application/pdf"
-                )
-            except Exception as pdf_error:
-                st.error(f"PDF export failed: {pdf_error}")
+                ),
+                file_name=f"{st.session_state.generated_initiative_name}_report.pdf",
+                mime="application/pdf"
+            )
         else:
             st.warning("PDF export unavailable. Install: pip install reportlab")
     
     with col2:
         if EXCEL_AVAILABLE:
-            try:
-                excel_buffer = export_to_excel(
-                    st.session_state.generated_df, 
-                    st.session_state.generated_next_df, 
+            st.download_button(
+                "📥 Download Excel",
+                _deferred_export(
+                    "Excel",
+                    export_to_excel,
+                    st.session_state.generated_df,
+                    st.session_state.generated_next_df,
                     st.session_state.generated_report
-                )
-                st.download_button(
-                    "📥 Download Excel",
-                    excel_buffer,
-                    file_name=f"{st.session_state.generated_initiative_name}_report.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
-            except Exception as excel_error:
-                st.error(f"Excel export failed: {excel_error}")
+                ),
+                file_name=f"{st.session_state.generated_initiative_name}_report.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
         else:
-            st.warning("Excel export unavailable. Install: pip install openpyxl")
\ No newline at end of file
+            st.warning("Excel export unavailable. Install: pip install xlsxwriter")
@@ -17,6 +17,9 @@ import os
 from atlassian import Jira
 from typing import Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from config import JIRA_FETCH_WORKERS
 
 
 def load_secure_credentials() -> Dict[str, Optional[str]]:
@@ -29,11 +32,15 @@ def load_secure_credentials() -> Dict[str, Optional[str]]:
     Returns:
         Dict with jira_email, jira_token, jira_url, groq_api_key
     """
+    # Read each secrets section once; separate names so sections can't alias
+    jira_secrets = st.secrets.get("jira", {})
+    groq_secrets = st.secrets.get("groq", {})
+    
     return {
-        'jira_email': st.secrets.get("jira", {}).get("jira_email") or os.getenv("JIRA_EMAIL"),
-        'jira_token': st.secrets.get("jira", {}).get("jira_token") or os.getenv("JIRA_API_TOKEN"),
-        'jira_url': st.secrets.get("jira", {}).get("jira_default_url") or os.getenv("JIRA_DEFAULT_URL"),
-        'groq_api_key': st.secrets.get("groq", {}).get("groq_api_key") or os.getenv("GROQ_API_KEY")
+        'jira_email': jira_secrets.get("jira_email") or os.getenv("JIRA_EMAIL"),
+        'jira_token': jira_secrets.get("jira_token") or os.getenv("JIRA_API_TOKEN"),
+        'jira_url': jira_secrets.get("jira_default_url") or os.getenv("JIRA_DEFAULT_URL"),
+        'groq_api_key': groq_secrets.get("groq_api_key") or os.getenv("GROQ_API_KEY")
     }
 
 
@@ -90,6 +97,63 @@ Common mistake: Using 'email' instead of 'jira_email', or 'api_token' instead of
     return True, "✅ Credentials format valid"
 
 
+def _mount_pooled_adapter(client: Jira) -> None:
+    """
+    Size the client's connection pool for concurrent page fetches.
+
+    The default pool keeps 10 connections per host; parallel paging plus the
+    background epic/next-period fetches can exceed that. 429/5xx responses
+    on GETs are retried with backoff, honouring Jira's Retry-After header.
+    """
+    pool_size = JIRA_FETCH_WORKERS * 2
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    )
+    client._session.mount('https://', adapter)
+    client._session.mount('http://', adapter)
+
+
+@st.cache_resource(ttl=900, show_spinner=False, max_entries=16)
+def get_jira_client(url: str, username: str, credential: str,
+                    is_cloud: bool = True, verify_ssl: bool = True) -> Jira:
+    """
+    Build and verify a Jira client once per credential set.
+
+    REQUIREMENT: Jira Integration - Connection reuse across reruns
+    Cached as a Streamlit resource so the client's requests.Session
+    (keep-alive TCP/TLS connection) survives reruns. Failed logins raise
+    and are not cached. Entries expire after 15 minutes so revoked or
+    rotated credentials are re-verified; call get_jira_client.clear() to
+    force a reconnect sooner.
+
+    Args:
+        url: Jira instance URL
+        username: Email (Cloud) or Username (On-Premise)
+        credential: API Token (Cloud) or Password/PAT (On-Premise)
+        is_cloud: True for Jira Cloud, False for On-Premise
+        verify_ssl: SSL verification (only relevant for On-Premise)
+
+    Returns:
+        Authenticated Jira client
+    """
+    client = Jira(
+        url=url,
+        username=username,
+        password=credential,
+        cloud=is_cloud,
+        verify_ssl=verify_ssl
+    )
+    _mount_pooled_adapter(client)
+
+    # Verify authentication once; cached callers skip this round-trip
+    client.myself()
+
+    return client
+
+
 def authenticate_jira_cloud(url: str, email: str, token: str) -> Jira:
     """
     Authenticate with Jira Cloud using email and API token.
@@ -36,8 +36,9 @@ APP_ICON = "🚀"
 # REQUIREMENT: Pagination and Scalability
 # Controls how many issues fetched per API call to avoid timeouts
 
-JIRA_MAX_RESULTS_PER_PAGE = 50  # Optimal for Jira Cloud API
+JIRA_MAX_RESULTS_PER_PAGE = 1000  # Requested page size; fetch adapts if the server caps lower
 JIRA_TOTAL_MAX_RESULTS = 1000   # Maximum issues to fetch per query
+JIRA_FETCH_WORKERS = 8          # Concurrent page requests after the first page
 JIRA_API_VERSION = "3"           # Jira Cloud REST API version
 JIRA_TIMEOUT_SECONDS = 30        # API request timeout
 
@@ -15,12 +15,17 @@ REQUIREMENTS ADDRESSED:
 Generated with On-Premise Support
 """
 
+import io
 from atlassian import Jira
 import pandas as pd
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Tuple, Optional
+import requests
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Dict, Tuple, Optional
 import streamlit as st
 from version_detector import JiraVersionDetector
+from config import JIRA_MAX_RESULTS_PER_PAGE, JIRA_TOTAL_MAX_RESULTS, JIRA_FETCH_WORKERS
 
 PERSONA_PROMPTS = {
     "team_lead": """Generate a detailed ticket-level report summarizing completed Jira tickets for the specified project, labels, and time period. 
@@ -94,6 +99,17 @@ Deliverables directly support annual OKRs focused on performance, reliability, a
 """
 }
 
+# Issue fields read by the report, next-steps table and judge - requesting
+# only these keeps search responses small (the default is every field)
+ISSUE_FIELDS = [
+    'summary', 'description', 'status', 'assignee', 'priority', 'duedate',
+    'created', 'updated', 'resolutiondate', 'parent', 'subtasks'
+]
+
+# Next-steps table only reads these (see next_steps_to_dataframe)
+NEXT_STEP_FIELDS = ['summary', 'status', 'priority']
+
+
 class JiraClient:
     """
     Wrapper for Jira API interactions.
@@ -111,13 +127,31 @@ class JiraClient:
             is_cloud: True for Jira Cloud, False for On-Premise
         """
         self.jira = jira
+        self.is_cloud = is_cloud
         self.detector = JiraVersionDetector(jira)
-        self.jira_type = self.detector.detect_jira_type()
-        self.api_version = self.detector.detect_api_version()
         
-        # Detect API version for on-prem
-        if not is_cloud:
-            self.api_version = self._detect_api_version()
+        # Detected on first access - fetching issues never needs them, and
+        # probing serverInfo here cost extra round-trips per wrapper call
+        self._jira_type = None
+        self._api_version = None
+    
+    @property
+    def jira_type(self) -> str:
+        """Cloud or On-Premise, detected lazily"""
+        if self._jira_type is None:
+            self._jira_type = self.detector.detect_jira_type()
+        return self._jira_type
+    
+    @property
+    def api_version(self) -> str:
+        """REST API version, detected lazily"""
+        if self._api_version is None:
+            if self.is_cloud:
+                self._api_version = self.detector.detect_api_version()
+            else:
+                # Detect API version for on-prem
+                self._api_version = self._detect_api_version()
+        return self._api_version
     
     def _detect_api_version(self) -> str:
         """
@@ -134,33 +168,121 @@ class JiraClient:
             # Fall back to v2
             return "v2"
     
-    def fetch_issues(self, jql: str, max_results: int = 1000, debug: bool = False) -> List[Dict]:
+    def iter_issue_pages(self, jql: str, max_results: int = JIRA_TOTAL_MAX_RESULTS,
+                         fields: List[str] = ISSUE_FIELDS,
+                         batch_size: int = JIRA_MAX_RESULTS_PER_PAGE,
+                         first_page: Optional[Dict] = None) -> Iterator[List[Dict]]:
+        """
+        Yield search result pages as they arrive.
+        
+        REQUIREMENT: Pagination and Scalability - handles 1000+ issues
+        As soon as a page is known not to be the last, the next one is
+        requested in the background, so the caller processes page N while
+        page N+1 downloads. Pages of `batch_size` are requested; when the
+        server caps a page lower, the remaining pages use the size it
+        actually returned. Pass `first_page` (the response for startAt=0)
+        when it has already been fetched, so it is not requested again.
+        
+        Responses without a `total` (Jira Cloud enhanced search, which
+        rejects startAt > 0) are followed by nextPageToken until isLast.
+        """
+        def fetch(start_at, limit):
+            return self.jira.jql(jql, fields=fields, start=start_at, limit=limit)
+        
+        def fetch_token(token, limit):
+            return self.jira.enhanced_jql(jql, fields=fields, nextPageToken=token, limit=limit)
+        
+        page_size = batch_size
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            if first_page is None:
+                pending = prefetcher.submit(fetch, 0, page_size)
+            else:
+                pending = Future()
+                pending.set_result(first_page)
+            while pending is not None:
+                result = pending.result()
+                batch = result.get('issues', [])[:max_results - fetched]
+                if not batch:
+                    return
+                
+                fetched += len(batch)
+                pending = None
+                
+                if 'total' in result:
+                    if fetched < min(result['total'], max_results):
+                        # Server-side cap: echoed maxResults, or a short non-final page
+                        page_size = min(page_size, result.get('maxResults') or page_size, len(batch))
+                        pending = prefetcher.submit(fetch, fetched, page_size)
+                elif fetched < max_results and not result.get('isLast', True) and result.get('nextPageToken'):
+                    # Token-paged search: no total or offsets, only a cursor
+                    pending = prefetcher.submit(fetch_token, result['nextPageToken'], page_size)
+                
+                yield batch
+    
+    def fetch_issues(self, jql: str, max_results: int = JIRA_TOTAL_MAX_RESULTS, debug: bool = False,
+                     fields: List[str] = ISSUE_FIELDS,
+                     batch_size: int = JIRA_MAX_RESULTS_PER_PAGE) -> List[Dict]:
         """
         Fetch issues with pagination.
         
         REQUIREMENT: Pagination and Scalability - handles 1000+ issues
         Works with both Cloud and On-Premise Jira
+        Only `fields` are requested (ISSUE_FIELDS by default).
+        See iter_issue_pages to process pages while later ones download.
         """
         issues = []
-        page_size = 50
-        start_at = 0
-        
-        while len(issues) < max_results:
-            result = self.jira.jql(jql, start=start_at, limit=page_size)
-            batch = result.get('issues', [])
-            
-            if not batch:
-                break
-            
+        for batch in self.iter_issue_pages(jql, max_results=max_results, fields=fields,
+                                           batch_size=batch_size):
             issues.extend(batch)
-            total = result.get('total', 0)
-            
-            if len(issues) >= total or len(batch) < page_size:
-                break
+        return issues
+    
+    def fetch_issues_parallel(self, jql: str, max_results: int = JIRA_TOTAL_MAX_RESULTS,
+                              page_size: int = JIRA_MAX_RESULTS_PER_PAGE, workers: int = JIRA_FETCH_WORKERS,
+                              fields: List[str] = ISSUE_FIELDS) -> List[Dict]:
+        """
+        Fetch issues with concurrent pagination.
+        
+        REQUIREMENT: Pagination and Scalability - large initiatives
+        The first page reports the total; the remaining pages are requested
+        concurrently over the shared session and reassembled in order.
+        Workers are capped (JIRA_FETCH_WORKERS) to stay within Jira rate limits.
+        """
+        first = self.jira.jql(jql, fields=fields, start=0, limit=page_size)
+        issues = first.get('issues', [])
+        
+        if 'total' not in first:
+            # No total to plan pages from (Cloud enhanced search) - follow
+            # nextPageToken sequentially, continuing from the page in hand
+            issues = []
+            for batch in self.iter_issue_pages(jql, max_results=max_results, fields=fields,
+                                               batch_size=page_size, first_page=first):
+                issues.extend(batch)
+            return issues
+        
+        total = min(first['total'], max_results)
+        # The server may cap page size below what was requested
+        step = min(page_size, first.get('maxResults') or page_size)
+        if issues and len(issues) < min(step, total):
+            step = len(issues)
+        starts = list(range(step, total, step))
+        
+        if issues and starts:
+            def fetch_page(start_at):
+                try:
+                    result = self.jira.jql(jql, fields=fields, start=start_at, limit=step)
+                except Exception:
+                    # One failed page shouldn't discard the others - retry it
+                    # once; a second failure fails the fetch rather than
+                    # silently returning a report with a hole in it
+                    result = self.jira.jql(jql, fields=fields, start=start_at, limit=step)
+                return result.get('issues', [])
             
-            start_at += page_size
+            with ThreadPoolExecutor(max_workers=min(workers, len(starts))) as pool:
+                for batch in pool.map(fetch_page, starts):
+                    issues.extend(batch)
         
-        return issues
+        return issues[:max_results]
     
     def get_epic_context(self, epic_key: str) -> Dict:
         """
@@ -169,12 +291,8 @@ class JiraClient:
         Works with both Cloud and On-Premise.
         """
         try:
-            issue = self.jira.issue(epic_key)
-            fields = issue.get('fields', {})
-            return {
-                'summary': fields.get('summary') or 'No summary available',
-                'description': fields.get('description') or 'No description available'
-            }
+            issue = self.jira.issue(epic_key, fields='summary,description')
+            return _epic_context(issue.get('fields', {}))
         except:
             return {'summary': 'Unable to fetch epic', 'description': ''}
     
@@ -194,7 +312,8 @@ class JiraClient:
                 return []
         except:
             # Fallback to JQL method
-            result = self.jira.jql('assignee = currentUser() OR reporter = currentUser()', limit=100)
+            result = self.jira.jql('assignee = currentUser() OR reporter = currentUser()',
+                                   fields='project', limit=100)
             issues = result.get('issues', [])
             unique_projects = {}
             for issue in issues:
@@ -204,6 +323,19 @@ class JiraClient:
             return [{'key': k, 'name': v} for k, v in unique_projects.items()]
 
 
+# Relative periods -> lookback from today for the JQL start date
+PERIOD_LOOKBACK = {
+    'last_week': timedelta(weeks=1),
+    'last_month': timedelta(days=30),
+}
+
+
+@lru_cache(maxsize=8)
+def _period_start(period: str, today: date) -> str:
+    """JQL start date for a relative period; `today` rolls the cache daily"""
+    return (today - PERIOD_LOOKBACK[period]).isoformat()
+
+
 class JQLBuilder:
     """
     Constructs JQL queries with business logic.
@@ -250,11 +382,8 @@ class JQLBuilder:
         
         if period:
             resolution_field = JQLBuilder._get_resolution_field(is_cloud)
-            if period == 'last_week':
-                start_date = (datetime.now() - timedelta(weeks=1)).strftime('%Y-%m-%d')
-                jql_parts.append(f'{resolution_field} >= {start_date}')
-            elif period == 'last_month':
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+            if period in PERIOD_LOOKBACK:
+                start_date = _period_start(period, date.today())
                 jql_parts.append(f'{resolution_field} >= {start_date}')
             elif ' to ' in period:
                 start, end = period.split(' to ')
@@ -285,11 +414,8 @@ class JQLBuilder:
         
         if period:
             duedate_field = JQLBuilder._get_duedate_field(is_cloud)
-            if period == 'last_week':
-                start_date = (datetime.now() - timedelta(weeks=1)).strftime('%Y-%m-%d')
-                jql_parts.append(f'{duedate_field} >= {start_date}')
-            elif period == 'last_month':
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+            if period in PERIOD_LOOKBACK:
+                start_date = _period_start(period, date.today())
                 jql_parts.append(f'{duedate_field} >= {start_date}')
             elif ' to ' in period:
                 start, end = period.split(' to ')
@@ -314,14 +440,11 @@ def build_jql(spaces=None, labels=None, time_period=None, time_field='resolution
         else:
             jql_parts.append(f'project in ({", ".join(quoted_projects)})')
     if labels:
-        label_list = [f'"{label.strip()}"' for label in labels.split(',')]
-        jql_parts.append(f'labels IN ({", ".join(label_list)})')
+        label_list = ', '.join(f'"{label.strip()}"' for label in labels.split(','))
+        jql_parts.append(f'labels IN ({label_list})')
     if time_period:
-        if time_period == 'last_week':
-            start_date = (datetime.now() - timedelta(weeks=1)).strftime('%Y-%m-%d')
-            jql_parts.append(f'{time_field} >= {start_date}')
-        elif time_period == 'last_month':
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        if time_period in PERIOD_LOOKBACK:
+            start_date = _period_start(time_period, date.today())
             jql_parts.append(f'{time_field} >= {start_date}')
         elif ' to ' in time_period:
             start, end = time_period.split(' to ')
@@ -350,180 +473,375 @@ def get_next_period_dates(current_period: str) -> str:
     return f"{next_start.strftime('%Y-%m-%d')} to {next_end.strftime('%Y-%m-%d')}"
 
 
-def fetch_issues(jira, jql, debug=False):
+def fetch_issues(jira, jql, debug=False, batch_size=JIRA_MAX_RESULTS_PER_PAGE,
+                 max_workers=JIRA_FETCH_WORKERS, fields=ISSUE_FIELDS):
     """
     Standalone fetch_issues for backward compatibility.
     
     Works with both Cloud and On-Premise Jira.
+    The first page gives the total; the remaining startAt windows are
+    fetched concurrently by up to max_workers threads, in page order.
+    max_workers=1 pages sequentially.
     """
     # Detect if cloud based on URL
     is_cloud = '.atlassian.net' in getattr(jira, 'url', '')
     
     client = JiraClient(jira, is_cloud=is_cloud)
-    return client.fetch_issues(jql, debug=debug)
+    if max_workers <= 1:
+        return client.fetch_issues(jql, debug=debug, fields=fields, batch_size=batch_size)
+    return client.fetch_issues_parallel(jql, page_size=batch_size, workers=max_workers, fields=fields)
 
 
-def get_epic_context(jira, epic_key):
+def iter_issues(jira, jql, fields=ISSUE_FIELDS):
     """
-    Standalone wrapper for backward compatibility.
+    Standalone streaming fetch - yields issues one page at a time.
     
-    Works with both Cloud and On-Premise.
+    Consumers such as next_steps_to_dataframe build their rows while later
+    pages download, without holding the raw issue list.
     """
     is_cloud = '.atlassian.net' in getattr(jira, 'url', '')
     client = JiraClient(jira, is_cloud=is_cloud)
-    return client.get_epic_context(epic_key)
+    for batch in client.iter_issue_pages(jql, fields=fields):
+        yield from batch
+
+
+def fetch_issues_parallel(jira, jql, page_size=JIRA_MAX_RESULTS_PER_PAGE, workers=JIRA_FETCH_WORKERS,
+                          fields=ISSUE_FIELDS):
+    """
+    Standalone parallel fetch - see JiraClient.fetch_issues_parallel.
+    
+    Works with both Cloud and On-Premise Jira.
+    """
+    return fetch_issues(jira, jql, batch_size=page_size, max_workers=workers, fields=fields)
+
+
+def _epic_context(fields: Dict) -> Dict:
+    """Summary/description pair for the report's CONTEXT section"""
+    return {
+        'summary': fields.get('summary') or 'No summary available',
+        'description': fields.get('description') or 'No description available'
+    }
+
+
+@st.cache_data(ttl=600, show_spinner=False, max_entries=64)
+def _fetch_epic_context(_jira, jira_url: str, account: str, epic_key: str) -> Dict:
+    """
+    Cached epic lookup, keyed on (jira_url, account, epic_key).
+    
+    The account keeps one user's epics from being served to another user
+    of the same Jira who may lack permission to see them. The client itself
+    is not hashed (leading underscore). Raises on failure so that errors are
+    never cached.
+    """
+    issue = _jira.issue(epic_key, fields='summary,description')
+    return _epic_context(issue.get('fields', {}))
+
+
+def get_epic_context(jira, epic_key):
+    """
+    Standalone wrapper for backward compatibility.
+    
+    Works with both Cloud and On-Premise. Results are cached per account
+    for 10 minutes so persona reruns and judge retries skip the round-trip.
+    """
+    try:
+        return _fetch_epic_context(jira, str(getattr(jira, 'url', '')),
+                                   str(getattr(jira, 'username', '')), epic_key)
+    except Exception:
+        return {'summary': 'Unable to fetch epic', 'description': ''}
+
+
+PROJECT_PAGE_SIZE = 50
+PROJECT_PAGE_WORKERS = 4
+
+
+def _search_projects(jira, endpoint: str) -> List[Dict]:
+    """
+    Collect every page of the Cloud project/search endpoint.
+    
+    The first page reports the total, so the remaining pages are requested
+    concurrently. Without a total, pages are walked one by one until isLast.
+    """
+    def page(start_at):
+        return jira.get(endpoint, params={'startAt': start_at,
+                                          'maxResults': PROJECT_PAGE_SIZE})
+    
+    first = page(0)
+    projects = list(first.get('values', []))
+    if first.get('isLast', True) or not projects:
+        return projects
+    
+    total = first.get('total')
+    if total:
+        step = first.get('maxResults') or len(projects)
+        starts = list(range(step, total, step))
+        if starts:
+            with ThreadPoolExecutor(max_workers=min(PROJECT_PAGE_WORKERS, len(starts))) as pool:
+                for result in pool.map(page, starts):
+                    projects.extend(result.get('values', []))
+        return projects
+    
+    start_at = len(projects)
+    while True:
+        result = page(start_at)
+        values = result.get('values', [])
+        projects.extend(values)
+        if result.get('isLast', True) or not values:
+            return projects
+        start_at += len(values)
+
+
+def discover_projects(jira, is_cloud=True) -> Tuple[Dict[str, str], str]:
+    """
+    Map accessible project keys to project names.
+
+    REQUIREMENT: Project discovery for user-provided Jira
+    Goes straight to the endpoint matching the deployment (v3 search on
+    Cloud, v2 list on On-Premise) instead of probing both in sequence.
+    The JQL scan over the user's own issues only runs when that endpoint
+    answers with an HTTP error; connection failures propagate.
+
+    Cloud results are paged (PROJECT_PAGE_SIZE per request, later pages
+    fetched concurrently) so tenants with many projects are listed in full.
+
+    Returns:
+        (project_names, source) - {key: name} and a label for the method used
+    """
+    if is_cloud:
+        endpoint, source = 'rest/api/3/project/search', 'API v3'
+    else:
+        endpoint, source = 'rest/api/2/project', 'API v2'
+
+    try:
+        if is_cloud:
+            projects = _search_projects(jira, endpoint)
+        else:
+            projects = jira.get(endpoint) or []
+        if projects:
+            return {p['key']: p.get('name', 'Unknown') for p in projects}, source
+    except requests.exceptions.HTTPError:
+        pass
+
+    # Fallback to JQL method - only the project field is needed
+    result = jira.jql('assignee = currentUser() OR reporter = currentUser()',
+                      fields='project', limit=100)
+    unique_projects = {
+        proj['key']: proj.get('name', 'Unknown')
+        for issue in result.get('issues', [])
+        if (proj := issue.get('fields', {}).get('project'))
+    }
+    return unique_projects, 'from your issues'
+
+
+ISSUE_COLUMNS = [
+    'Key', 'Summary', 'Description', 'Status', 'Assignee', 'Priority',
+    'Due Date', 'Created', 'Updated', 'Resolved', 'Parent', 'Subtasks'
+]
+NEXT_STEP_COLUMNS = ['Key', 'Summary', 'Status', 'Priority']
+
+# LLM instruction per persona; {persona_prompt} and {hierarchy} are filled in
+# per report. Unknown personas fall back to DEFAULT_SUMMARY_PROMPT.
+SUMMARY_PROMPTS = {
+    'team_lead': "Summarize these completed Jira tickets for a team lead (technical details matter):\n{persona_prompt}\n{hierarchy}",
+    'manager': "Write a concise executive paragraph summarizing these achievements for a manager (focus on outcomes, not technical details):\n{persona_prompt}\n{hierarchy}",
+    'group_manager': "Write a strategic summary for a group manager highlighting business impact and team performance:\n{persona_prompt}\n{hierarchy}",
+    'cto': "Write a high-level executive summary for CTO highlighting strategic value and key deliverables:\n{persona_prompt}\n{hierarchy}",
+}
+DEFAULT_SUMMARY_PROMPT = "Summarize these completed Jira tickets:\n{hierarchy}"
+
+
+def issues_to_dataframe(issues):
+    """
+    Flatten raw Jira issues into the report DataFrame.
+    
+    REQUIREMENT: Generate Executive Reports - Shared issue table
+    Built once per fetch and reused by report generation and judge retries.
+    Rows are plain tuples handed to DataFrame.from_records in one go, with
+    each nested field looked up once. Status, Assignee and Priority are
+    categorical.
+    
+    Returns:
+        DataFrame with ISSUE_COLUMNS, one row per issue
+    """
+    rows = []
+    for issue in issues:
+        fields = issue.get('fields', {})
+        status = fields.get('status')
+        assignee = fields.get('assignee')
+        priority = fields.get('priority')
+        parent = fields.get('parent')
+        rows.append((
+            issue.get('key'),
+            fields.get('summary', 'N/A'),
+            fields.get('description', ''),
+            status.get('name', 'N/A') if status else 'N/A',
+            assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned',
+            priority.get('name', 'N/A') if priority else 'N/A',
+            fields.get('duedate'),
+            fields.get('created'),
+            fields.get('updated'),
+            fields.get('resolutiondate'),
+            parent.get('key') if parent else None,
+            [sub.get('key') for sub in fields.get('subtasks', [])]
+        ))
+    df = pd.DataFrame.from_records(rows, columns=ISSUE_COLUMNS)
+    # Low-cardinality columns: masks like Status == 'Done' compare int codes
+    return df.astype({'Status': 'category', 'Assignee': 'category', 'Priority': 'category'})
+
+
+def next_steps_to_dataframe(issues):
+    """Flatten next-period issues into the Key/Summary/Status/Priority table"""
+    rows = []
+    for issue in issues:
+        fields = issue.get('fields', {})
+        status = fields.get('status')
+        rows.append((
+            issue.get('key'),
+            fields.get('summary', 'N/A'),
+            status.get('name', 'N/A') if status else 'N/A',
+            (fields.get('priority') or {}).get('name', 'N/A')
+        ))
+    df = pd.DataFrame.from_records(rows, columns=NEXT_STEP_COLUMNS)
+    return df.astype({'Status': 'category', 'Priority': 'category'})
 
 
 def generate_report(issues, persona, llm_provider, api_key, initiative_name, current_period, 
-                   jira_client, spaces, labels, groq_model=None, persona_prompt=None):
+                   jira_client, spaces, labels, groq_model=None, persona_prompt=None,
+                   issues_df=None, summary_writer=None, next_issues=None, refresh_summary=False):
     """
     Generate complete 4-section executive report.
     
     REQUIREMENT: Generate Executive Reports - Structured status reports
     Works with both Cloud and On-Premise Jira
+    
+    Pass issues_df (from issues_to_dataframe) to skip re-flattening the issues.
+    Pass summary_writer (e.g. st.write_stream) to render the AI summary as it
+    streams in; it receives a chunk iterator and must return the full text.
+    Pass next_issues (next-period issues fetched alongside `issues`) to skip
+    the next-steps query. Pass refresh_summary=True to request a new AI
+    summary instead of reusing a cached one.
     """
     if not issues:
         return f"❌ No issues found for {initiative_name}.", pd.DataFrame(), pd.DataFrame()
     
-    # Import LLM function
-    from llm_integrations import get_llm_summary
+    # Import LLM functions
+    from llm_integrations import get_llm_summary, stream_llm_summary
     
     # Detect if cloud
     is_cloud = '.atlassian.net' in getattr(jira_client, 'url', '')
     
-    # Build issues dictionary
-    data = []
-    issues_dict = {}
-    for issue in issues:
-        fields = issue.get('fields', {})
-        key = issue.get('key')
-        parent_key = fields.get('parent', {}).get('key') if fields.get('parent') else None
-        subtasks_keys = [sub.get('key') for sub in fields.get('subtasks', [])]
-        issues_dict[key] = {
-            'Key': key,
-            'Summary': fields.get('summary', 'N/A'),
-            'Description': fields.get('description', ''),
-            'Status': fields.get('status', {}).get('name', 'N/A') if fields.get('status') else 'N/A',
-            'Assignee': fields.get('assignee', {}).get('displayName', 'Unassigned') if fields.get('assignee') else 'Unassigned',
-            'Priority': fields.get('priority', {}).get('name', 'N/A') if fields.get('priority') else 'N/A',
-            'Due Date': fields.get('duedate'),
-            'Created': fields.get('created'),
-            'Updated': fields.get('updated'),
-            'Resolved': fields.get('resolutiondate'),
-            'Parent': parent_key,
-            'Subtasks': subtasks_keys
-        }
-        data.append(issues_dict[key])
-    
-    df = pd.DataFrame(data)
-    achieved_df = df[df['Status'] == 'Done']
+    # Build issues table; key lookups go through its hash index
+    df = issues_df if issues_df is not None else issues_to_dataframe(issues)
+    by_key = df.set_index('Key')
+    done = df['Status'].eq('Done')
+    achieved_df = df[done]
     achieved_keys = achieved_df['Key'].tolist()
     
-    # Get epic context
-    roots = [key for key in achieved_keys if issues_dict[key]['Parent'] is None or issues_dict[key]['Parent'] not in achieved_keys]
+    # Roots: completed tickets whose parent isn't also completed
+    achieved_set = set(achieved_keys)
+    parents = achieved_df['Parent']
+    roots = achieved_df.loc[parents.isna() | ~parents.isin(achieved_set), 'Key'].tolist()
     epic_key = roots[0] if roots else None
     
-    if epic_key:
-        epic_data = get_epic_context(jira_client, epic_key)
-        summary = epic_data.get('summary') or ''
-        description = epic_data.get('description') or ''
-        overview = f"{summary[:100]}. {description[:150]}"[:200].strip()
-    else:
-        overview = f"{initiative_name} initiative overview not available."
+    # Epic context and next-period tickets don't depend on the AI summary -
+    # fetch them in the background while the LLM call is in flight
+    io_pool = ThreadPoolExecutor(max_workers=2)
+    epic_future = io_pool.submit(get_epic_context, jira_client, epic_key) if epic_key else None
+    next_future = None
+    if next_issues is None:
+        next_period = get_next_period_dates(current_period)
+        next_jql = build_jql(spaces, labels, next_period, time_field='duedate', is_cloud=is_cloud)
+        next_future = io_pool.submit(next_steps_to_dataframe,
+                                     iter_issues(jira_client, next_jql, fields=NEXT_STEP_FIELDS))
+    io_pool.shutdown(wait=False)
     
     # Prior progress
-    if current_period in ['last_week', 'last_month']:
-        period_end = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    if current_period in PERIOD_LOOKBACK:
+        period_end = now
     else:
         end_date_str = current_period.split(' to ')[1]
         period_end = datetime.strptime(end_date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
     
-    prior_keys = []
-    for k in achieved_keys:
-        resolved_date = issues_dict[k].get('Resolved')
-        if resolved_date:
-            try:
-                resolved_dt = datetime.fromisoformat(resolved_date.replace('Z', '+00:00'))
-                if resolved_dt < period_end:
-                    prior_keys.append(k)
-            except:
-                pass
+    # Parse the whole Resolved column at once; unparseable dates become NaT
+    resolved = pd.to_datetime(achieved_df['Resolved'], utc=True, errors='coerce', format='ISO8601')
+    prior_count = int((resolved < pd.Timestamp(period_end)).sum())
     
-    prior_summary = f"{len(prior_keys)} items completed prior to this period." if prior_keys else "No prior progress."
+    prior_summary = f"{prior_count} items completed prior to this period." if prior_count else "No prior progress."
     
     # Build hierarchy
-    def build_hierarchical_text(issues_dict, roots, indent=''):
-        text = ''
-        for key in roots:
-            row = issues_dict.get(key, {})
-            text += f"{indent}{key}: {row.get('Summary', 'N/A')}\n"
-            subtasks = row.get('Subtasks', [])
-            text += build_hierarchical_text(issues_dict, subtasks, indent + '  ')
-        return text
+    def build_hierarchical_text(roots):
+        # Iterative depth-first walk - no recursion limit, no repeated concat
+        summaries, subtasks = by_key['Summary'], by_key['Subtasks']
+        buf = io.StringIO()
+        stack = [(key, '') for key in reversed(roots)]
+        while stack:
+            key, indent = stack.pop()
+            buf.write(f"{indent}{key}: {summaries.get(key, 'N/A')}\n")
+            stack.extend((sub, indent + '  ') for sub in reversed(subtasks.get(key, [])))
+        return buf.getvalue()
     
     # Persona-specific formatting
-    if persona == 'team_lead':
-        hierarchy_text = build_hierarchical_text(issues_dict, roots)
-    elif persona == 'manager':
-        completed_summaries = [issues_dict[k]['Summary'] for k in achieved_keys[:10]]
-        hierarchy_text = f"Completed {len(achieved_keys)} tickets this period. Key accomplishments include: " + \
-                        ", ".join(completed_summaries[:5]) + \
-                        (f", and {len(achieved_keys)-5} other items" if len(achieved_keys) > 5 else ".")
-    elif persona == 'group_manager':
-        hierarchy_text = f"Team completed {len(achieved_keys)} of {len(df)} tickets ({len(achieved_keys)/len(df)*100:.0f}% completion rate). " + \
-                        f"Major deliverables: {', '.join([issues_dict[k]['Summary'][:40] for k in roots[:3]])}."
-    elif persona == 'cto':
-        hierarchy_text = f"Initiative delivered {len(achieved_keys)} items. " + \
-                        f"Primary outcomes: {', '.join([issues_dict[k]['Summary'][:50] for k in roots[:2]])}. " + \
-                        f"Team velocity: {len(achieved_keys)} items completed in period."
-    else:
-        hierarchy_text = build_hierarchical_text(issues_dict, roots)
+    completion_pct = len(achieved_df) / len(df) * 100
+    # Root summaries in achieved order, sliced column-wise below
+    root_summaries = achieved_df.loc[achieved_df['Key'].isin(set(roots)), 'Summary']
+    n_done = len(achieved_keys)
+    # Only the selected persona's formatter runs; unknown personas get the tree
+    persona_formatters = {
+        'team_lead': lambda: build_hierarchical_text(roots),
+        'manager': lambda: f"Completed {n_done} tickets this period. Key accomplishments include: " +
+                           ", ".join(achieved_df['Summary'].head(5)) +
+                           (f", and {n_done-5} other items" if n_done > 5 else "."),
+        'group_manager': lambda: f"Team completed {n_done} of {len(df)} tickets ({completion_pct:.0f}% completion rate). " +
+                                 f"Major deliverables: {', '.join(root_summaries.str.slice(0, 40).head(3))}.",
+        'cto': lambda: f"Initiative delivered {n_done} items. " +
+                       f"Primary outcomes: {', '.join(root_summaries.str.slice(0, 50).head(2))}. " +
+                       f"Team velocity: {n_done} items completed in period.",
+    }
+    hierarchy_text = persona_formatters.get(persona, persona_formatters['team_lead'])()
     
     # AI Summary
     achievements_summary = hierarchy_text
     if api_key and achieved_keys and llm_provider != "None":
-        if persona == 'team_lead':
-            prompt = f"Summarize these completed Jira tickets for a team lead (technical details matter):\n{persona_prompt}\n{hierarchy_text}"
-        elif persona == 'manager':
-            prompt = f"Write a concise executive paragraph summarizing these achievements for a manager (focus on outcomes, not technical details):\n{persona_prompt}\n{hierarchy_text}"
-        elif persona == 'group_manager':
-            prompt = f"Write a strategic summary for a group manager highlighting business impact and team performance:\n{persona_prompt}\n{hierarchy_text}"
-        elif persona == 'cto':
-            prompt = f"Write a high-level executive summary for CTO highlighting strategic value and key deliverables:\n{persona_prompt}\n{hierarchy_text}"
-        else:
-            prompt = f"Summarize these completed Jira tickets:\n{hierarchy_text}"
+        template = SUMMARY_PROMPTS.get(persona, DEFAULT_SUMMARY_PROMPT)
+        prompt = template.format(persona_prompt=persona_prompt, hierarchy=hierarchy_text)
             
-        ai_summary = get_llm_summary(llm_provider, api_key, prompt, groq_model)
+        if summary_writer:
+            ai_summary = summary_writer(stream_llm_summary(llm_provider, api_key, prompt, groq_model,
+                                                           refresh=refresh_summary))
+        else:
+            ai_summary = get_llm_summary(llm_provider, api_key, prompt, groq_model,
+                                         refresh=refresh_summary)
         
         if persona in ['manager', 'group_manager', 'cto']:
             achievements_summary = f"📖 {ai_summary}"
         else:
             achievements_summary += f"\n\n📖 AI SUMMARY:\n{ai_summary}"
     
-    # Next steps - USE DUE DATE (works on both Cloud and On-Prem)
-    next_period = get_next_period_dates(current_period)
-    next_jql = build_jql(spaces, labels, next_period, time_field='duedate', is_cloud=is_cloud)
-    next_issues = fetch_issues(jira_client, next_jql)
-    
-    if next_issues:
-        next_df = pd.DataFrame([{
-            'Key': i.get('key'),
-            'Summary': i.get('fields', {}).get('summary', 'N/A'),
-            'Status': i.get('fields', {}).get('status', {}).get('name', 'N/A') if i.get('fields', {}).get('status') else 'N/A',
-            'Priority': (i.get('fields', {}).get('priority') or {}).get('name', 'N/A')
-        } for i in next_issues])
-        
-        upcoming = next_df[next_df['Status'].isin(['To Do', 'In Progress'])]
+    # Get epic context
+    if epic_future:
+        epic_data = epic_future.result()
+        summary = epic_data.get('summary') or ''
+        description = epic_data.get('description') or ''
+        overview = f"{summary[:100]}. {description[:150]}"[:200].strip()
     else:
-        next_df = pd.DataFrame(columns=['Key', 'Summary', 'Status', 'Priority'])
-        upcoming = pd.DataFrame()
+        overview = f"{initiative_name} initiative overview not available."
     
+    # Next steps - USE DUE DATE (works on both Cloud and On-Prem)
+    next_df = next_future.result() if next_future else next_steps_to_dataframe(next_issues)
+    upcoming = next_df.loc[next_df['Status'].isin(['To Do', 'In Progress']), ['Key', 'Summary', 'Priority']]
+    
+    # Only the first five rows are rendered; zip their columns instead of iterrows
+    top = upcoming.head(5)
     next_steps = "📋 **NEXT STEPS**: No tickets scheduled." if len(upcoming) == 0 else \
         f"📋 **NEXT STEPS** ({len(upcoming)} tickets):\n" + "\n".join(
-            [f"• {row['Key']}: {row['Summary'][:50]}... ({row['Priority']})" for _, row in upcoming.head(5).iterrows()]
+            [f"• {key}: {summary[:50]}... ({priority})"
+             for key, summary, priority in zip(top['Key'], top['Summary'], top['Priority'])]
         )
     
-    overdue_count = len(df[(df['Due Date'].notna()) & (df['Status'] != 'Done')])
+    # Open tickets whose due date has passed, counted straight from the mask
+    due = pd.to_datetime(df['Due Date'], errors='coerce', format='ISO8601')
+    overdue_count = int(((due < pd.Timestamp(now.date())) & ~done).sum())
     
     report = f"""
 🏛️ **{initiative_name} - {persona.upper()} REPORT**
@@ -537,7 +855,7 @@ def generate_report(issues, persona, llm_provider, api_key, initiative_name, cur
 {achievements_summary}
 
 **3. METRICS**
-Total Issues: {len(df)} | Completed: {len(achieved_df)} ({len(achieved_df)/len(df)*100:.0f}%)
+Total Issues: {len(df)} | Completed: {len(achieved_df)} ({completion_pct:.0f}%)
 Overdue: {overdue_count}
 
 **4. BUSINESS IMPACT - FORWARD LOOKING**
@@ -663,7 +981,8 @@ def generate_report_with_validation(issues, persona, llm_provider, api_key, init
                                      current_period, jira_client, spaces, labels,
                                      enable_judge=False, judge_llm_provider=None, 
                                      judge_api_key=None, judge_model=None,
-                                     groq_model=None, persona_prompt=None, judge_prompt_template=None):
+                                     groq_model=None, persona_prompt=None, judge_prompt_template=None,
+                                     next_issues=None, refresh_summary=False):
     """
     Generate report with automatic AI judge validation and regeneration loop.
     
@@ -676,6 +995,8 @@ def generate_report_with_validation(issues, persona, llm_provider, api_key, init
         judge_api_key: API key for judge
         judge_model: Model for judge (Groq)
         judge_prompt_template: Custom judge prompt template
+        next_issues: Pre-fetched next-period issues, reused across attempts
+        refresh_summary: Skip cached AI summaries and judge evaluations
     
     Returns:
         tuple: (report, df, next_df, judge_evaluation, validation_passed)
@@ -689,6 +1010,11 @@ def generate_report_with_validation(issues, persona, llm_provider, api_key, init
     judge_evaluation = None
     regeneration_feedback = ""
     
+    # Flatten issues and build judge ticket data once, not per attempt
+    issues_df = issues_to_dataframe(issues) if issues else None
+    ticket_data = extract_ticket_data_for_judge(issues, persona)
+    ticket_count = len(issues)
+    
     while attempt < max_attempts:
         attempt += 1
         
@@ -703,7 +1029,8 @@ def generate_report_with_validation(issues, persona, llm_provider, api_key, init
         report, df, next_df = generate_report(
             issues, persona, llm_provider, api_key, initiative_name,
             current_period, jira_client, spaces, labels,
-            groq_model=groq_model, persona_prompt=enhanced_persona_prompt
+            groq_model=groq_model, persona_prompt=enhanced_persona_prompt,
+            issues_df=issues_df, next_issues=next_issues, refresh_summary=refresh_summary
         )
         
         # If judge disabled, return immediately
@@ -711,15 +1038,11 @@ def generate_report_with_validation(issues, persona, llm_provider, api_key, init
             return report, df, next_df, None, True
         
         # Run AI judge validation
-        ticket_data = extract_ticket_data_for_judge(issues, persona)
-        ticket_count = len(issues)
-        
         # Get judge prompt
-        persona_key = persona.lower().replace(' ', '_')
         if judge_prompt_template:
             judge_prompt = judge_prompt_template
         else:
-            judge_prompt = AI_JUDGE_PROMPTS.get(persona_key, AI_JUDGE_PROMPTS['team_lead'])
+            judge_prompt = AI_JUDGE_PROMPTS.get(persona, AI_JUDGE_PROMPTS['team_lead'])
         
         # Format judge prompt
         formatted_judge_prompt = judge_prompt.format(
@@ -733,7 +1056,8 @@ def generate_report_with_validation(issues, persona, llm_provider, api_key, init
             judge_llm_provider,
             judge_api_key,
             formatted_judge_prompt,
-            groq_model=judge_model
+            groq_model=judge_model,
+            refresh=refresh_summary
         )
         
         # Parse judge response
@@ -6,32 +6,81 @@ Groq, OpenAI, xAI, Gemini support with rate limit handling.
 Generated: 2025-10-19 18:28:32
 """
 
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
 import streamlit as st
 import requests
-from typing import Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Iterator, Optional, Tuple
+
+try:
+    from orjson import loads as _json_loads  # Optional: faster SSE chunk parsing
+except ImportError:
+    _json_loads = json.loads
+
+# Shared keep-alive session: repeated Groq/xAI calls reuse pooled TCP/TLS
+# connections. Transient 5xx responses are retried with backoff for GETs
+# only (the Groq model listing); completion POSTs are not idempotent - a
+# retry would bill and generate twice - so they are never retried. 429 is
+# left to the callers' rate-limit handling.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, allowed_methods=frozenset({"GET"}),
+                      status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+))
+
+# Completed summaries keyed on sha256(provider, model, api key hash, prompt).
+# The prompt already embeds the ticket text and persona prompt, so identical
+# inputs hit; the key hash keeps one user's paid summaries (and auth errors)
+# from being shared with sessions using other credentials.
+# Completions are sampled (temperature 0.7), so entries are short-lived and
+# callers can pass refresh=True to ask for a new one.
+SUMMARY_CACHE_SIZE = 64
+SUMMARY_CACHE_TTL = 10 * 60
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+# Responses starting with these are errors/rate limits and are never cached
+_UNCACHEABLE_PREFIXES = ("❌", "⚠️", "AI summary error")
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _fetch_groq_model_ids(api_key: str) -> list:
+    """
+    Cached Groq model listing, keyed on the API key.
+
+    Raises on failure so that errors are never cached - only successful
+    responses are reused across reruns and call sites.
+    """
+    response = _HTTP.get(
+        "https://api.groq.com/openai/v1/models",
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        },
+        timeout=10
+    )
+    response.raise_for_status()
+    models_data = response.json()
+    model_ids = [model['id'] for model in models_data.get('data', [])]
+    return sorted(model_ids)
 
 
-@st.cache_data(ttl=3600)
 def fetch_groq_models(api_key: str) -> list:
     """
     Fetch available Groq models dynamically.
-    
+
     REQUIREMENT: Multi-LLM Integration - Dynamic model discovery
     Cached for 1 hour to avoid repeated API calls.
     """
     try:
-        response = requests.get(
-            "https://api.groq.com/openai/v1/models",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        models_data = response.json()
-        model_ids = [model['id'] for model in models_data.get('data', [])]
-        return sorted(model_ids)
+        return _fetch_groq_model_ids(api_key)
     except Exception as e:
         st.error(f"Failed to fetch Groq models: {e}")
         return []
@@ -47,7 +96,7 @@ def call_groq_llm(prompt: str, model: str, api_key: str) -> Tuple[str, bool]:
         (response_text, is_rate_limited)
     """
     try:
-        response = requests.post(
+        response = _HTTP.post(
             "https://api.groq.com/openai/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -74,13 +123,138 @@ def call_groq_llm(prompt: str, model: str, api_key: str) -> Tuple[str, bool]:
         return f"❌ Error: {str(e)}", False
 
 
-def get_llm_summary(llm_provider: str, api_key: str, prompt: str, groq_model: str = None) -> str:
+def _summary_key(llm_provider: str, model: Optional[str], api_key: str, prompt: str) -> str:
+    """Stable cache key for one completion request, scoped to the API key"""
+    key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+    raw = "\x00".join([llm_provider, model or "", key_hash, prompt])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cached_summary(key: str) -> Optional[str]:
+    """Return a fresh cached summary, dropping it if expired"""
+    with _summary_cache_lock:
+        entry = _summary_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, text = entry
+        if time.time() - stored_at > SUMMARY_CACHE_TTL:
+            del _summary_cache[key]
+            return None
+        _summary_cache.move_to_end(key)
+        return text
+
+
+def _store_summary(key: str, text: str) -> None:
+    """Cache a successful summary, evicting the least recently used"""
+    if not text or text.startswith(_UNCACHEABLE_PREFIXES):
+        return
+    with _summary_cache_lock:
+        _summary_cache[key] = (time.time(), text)
+        _summary_cache.move_to_end(key)
+        while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+
+
+def stream_groq_llm(prompt: str, model: str, api_key: str) -> Iterator[str]:
+    """
+    Stream a Groq completion as text chunks (server-sent events).
+    
+    REQUIREMENT: Handle 429 rate limits
+    Yields the same rate-limit / error messages as the buffered call.
+    """
+    response = None
+    try:
+        response = _HTTP.post(
+            "https://api.groq.com/openai/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": 400,
+                "temperature": 0.7,
+                "stream": True
+            },
+            timeout=30,
+            stream=True
+        )
+        
+        if response.status_code == 429:
+            yield f"⚠️ Rate limit hit for {model}. Please select another model and regenerate."
+            return
+        
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            payload = line[len(b"data: "):]
+            if payload == b"[DONE]":
+                break
+            delta = _json_loads(payload)['choices'][0].get('delta', {}).get('content')
+            if delta:
+                yield delta
+    
+    except requests.exceptions.Timeout:
+        yield "⚠️ Request timeout. Try a different model."
+    except Exception as e:
+        yield f"❌ Error: {str(e)}"
+    finally:
+        if response is not None:
+            response.close()
+
+
+def stream_llm_summary(llm_provider: str, api_key: str, prompt: str, groq_model: str = None,
+                       refresh: bool = False) -> Iterator[str]:
+    """
+    Stream AI summary chunks from the selected provider.
+    
+    REQUIREMENT: Multi-LLM Integration - Progressive output
+    Groq streams token by token; other providers yield one complete chunk.
+    Cached summaries are yielded in one chunk without calling the provider,
+    unless refresh=True.
+    """
+    key = _summary_key(llm_provider, groq_model, api_key, prompt)
+    cached = None if refresh else _cached_summary(key)
+    if cached is not None:
+        yield cached
+        return
+    
+    if llm_provider == "Groq (Free Tier)" and groq_model:
+        chunks = []
+        for chunk in stream_groq_llm(prompt, groq_model, api_key):
+            chunks.append(chunk)
+            yield chunk
+        # A failed stream ends with an error chunk - don't cache partial text
+        if not any(c.startswith(_UNCACHEABLE_PREFIXES) for c in chunks):
+            _store_summary(key, "".join(chunks))
+    else:
+        yield get_llm_summary(llm_provider, api_key, prompt, groq_model, refresh=refresh)
+
+
+def get_llm_summary(llm_provider: str, api_key: str, prompt: str, groq_model: str = None,
+                    refresh: bool = False) -> str:
     """
     Get AI summary from selected provider.
     
     REQUIREMENT: Multi-LLM Integration
     Supports: Groq, OpenAI, xAI, Gemini
+    Successful responses are cached in-process (see SUMMARY_CACHE_SIZE/TTL).
+    Pass refresh=True to skip the cached summary; the new one replaces it.
     """
+    key = _summary_key(llm_provider, groq_model, api_key, prompt)
+    cached = None if refresh else _cached_summary(key)
+    if cached is not None:
+        return cached
+    
+    summary = _call_llm(llm_provider, api_key, prompt, groq_model)
+    _store_summary(key, summary)
+    return summary
+
+
+def _call_llm(llm_provider: str, api_key: str, prompt: str, groq_model: str = None) -> str:
+    """Dispatch one uncached completion to the selected provider"""
     try:
         if llm_provider == "Groq (Free Tier)":
             if not groq_model:
@@ -104,7 +278,7 @@ def get_llm_summary(llm_provider: str, api_key: str, prompt: str, groq_model: st
             return response.choices[0].message.content
         
         elif llm_provider == "xAI":
-            response = requests.post(
+            response = _HTTP.post(
                 "https://api.x.ai/v1/chat/completions",
                 headers={"Authorization": f"Bearer {api_key}"},
                 json={
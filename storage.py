@@ -8,31 +8,101 @@ Generated: 2025-10-19 19:02:26
 
 import json
 import os
+import threading
 import streamlit as st
 from typing import Optional, List, Dict
 
+try:
+    import orjson  # Optional: faster preset (de)serialization
+except ImportError:
+    orjson = None
+
 
 PRESETS_FILE = "jira_presets.json"
 
+# Parsed presets file, keyed by its (mtime, size) stamp
+_presets_cache = {'stamp': None, 'presets': {}}
+
+# Serializes read-modify-write cycles across concurrent Streamlit sessions
+_presets_lock = threading.RLock()
+
+
+def _file_stamp() -> Optional[tuple]:
+    """(mtime_ns, size) of the presets file, or None if it doesn't exist"""
+    try:
+        stat = os.stat(PRESETS_FILE)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _loads(data: bytes) -> Dict:
+    """Parse presets JSON with orjson when installed, else stdlib json"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(presets: Dict) -> bytes:
+    """Serialize presets as indented JSON bytes (users hand-edit and share the file)"""
+    if orjson:
+        return orjson.dumps(presets, option=orjson.OPT_INDENT_2)
+    return json.dumps(presets, indent=2).encode('utf-8')
+
+
+def _read_presets() -> Dict:
+    """
+    Return all presets, re-parsing the file only when it has changed.
+    
+    REQUIREMENT: Save and Load Criteria
+    The sidebar lists and loads presets on every rerun; a stat() call
+    replaces the open + JSON parse when the file is unchanged.
+    Callers must not mutate the returned dict.
+    """
+    with _presets_lock:
+        stamp = _file_stamp()
+        if stamp is None:
+            return {}
+        
+        if _presets_cache['stamp'] != stamp:
+            with open(PRESETS_FILE, 'rb') as f:
+                _presets_cache['presets'] = _loads(f.read())
+            _presets_cache['stamp'] = stamp
+        return _presets_cache['presets']
+
+
+def _write_presets(presets: Dict) -> None:
+    """
+    Write all presets and prime the cache with what was written.
+    
+    Writes a temp file and os.replace()s it over the presets file, so readers
+    (and the stamp cache) only ever see a complete old or new file.
+    """
+    tmp_path = f"{PRESETS_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(presets))
+        os.replace(tmp_path, PRESETS_FILE)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _presets_cache['presets'] = presets
+    _presets_cache['stamp'] = _file_stamp()
+
 
 def save_criteria(preset_name: str, criteria: Dict) -> bool:
     """
     Save preset to JSON file.
     
     REQUIREMENT: Save and Load Criteria
-    Stores user preferences for quick reuse.
+    Stores user preferences for quick reuse. The read-modify-write runs
+    under a lock so concurrent sessions can't drop each other's presets.
     """
     try:
-        if os.path.exists(PRESETS_FILE):
-            with open(PRESETS_FILE, 'r') as f:
-                presets = json.load(f)
-        else:
-            presets = {}
-        
-        presets[preset_name] = criteria
-        
-        with open(PRESETS_FILE, 'w') as f:
-            json.dump(presets, f, indent=2)
+        with _presets_lock:
+            presets = _read_presets()
+            # Re-saving an identical preset (e.g. repeated clicks) skips the rewrite
+            if presets.get(preset_name) != criteria:
+                _write_presets({**presets, preset_name: dict(criteria)})
         
         st.success(f"✅ Saved: {preset_name}")
         return True
@@ -43,26 +113,17 @@ def save_criteria(preset_name: str, criteria: Dict) -> bool:
 
 def load_criteria(preset_name: str) -> Optional[Dict]:
     """Load preset from JSON file"""
-    if not os.path.exists(PRESETS_FILE):
-        return None
-    
     try:
-        with open(PRESETS_FILE, 'r') as f:
-            presets = json.load(f)
-        return presets.get(preset_name)
+        preset = _read_presets().get(preset_name)
+        return dict(preset) if preset is not None else None
     except Exception:
         return None
 
 
 def get_all_presets() -> List[str]:
     """Get all preset names"""
-    if not os.path.exists(PRESETS_FILE):
-        return []
-    
     try:
-        with open(PRESETS_FILE, 'r') as f:
-            presets = json.load(f)
-        return list(presets.keys())
+        return list(_read_presets().keys())
     except Exception:
         return []
 
@@ -70,18 +131,13 @@ def get_all_presets() -> List[str]:
 def delete_preset(preset_name: str) -> None:
     """Delete preset from JSON file"""
     try:
-        if not os.path.exists(PRESETS_FILE):
-            return
-        
-        with open(PRESETS_FILE, 'r') as f:
-            presets = json.load(f)
+        with _presets_lock:
+            presets = _read_presets()
+            deleted = preset_name in presets
+            if deleted:
+                _write_presets({name: c for name, c in presets.items() if name != preset_name})
         
-        if preset_name in presets:
-            del presets[preset_name]
-            
-            with open(PRESETS_FILE, 'w') as f:
-                json.dump(presets, f, indent=2)
-            
+        if deleted:
             st.success(f"✅ Deleted: {preset_name}")
     except Exception as e:
         st.error(f"❌ Delete failed: {e}")
@@ -287,7 +287,35 @@ class TestPresetManagement:
         presets = get_all_presets()
         assert "to_delete" not in presets
         assert "to_keep" in presets
-    
+
+    def test_presets_reparsed_only_when_file_changes(self, cleanup_presets):
+        """Test unchanged preset file is served from the in-process cache"""
+        save_criteria("cached", {'spaces': 'AWS'})
+
+        import storage
+        with patch('storage._loads', wraps=storage._loads) as mock_load:
+            get_all_presets()
+            load_criteria("cached")
+            assert mock_load.call_count == 0
+
+            with open("jira_presets.json", 'w') as f:
+                json.dump({'cached': {'spaces': 'AWS'}, 'external': {}}, f)
+            assert "external" in get_all_presets()
+            assert mock_load.call_count == 1
+
+    def test_resaving_identical_preset_skips_write(self, cleanup_presets):
+        """Test saving an unchanged preset doesn't rewrite the file"""
+        import storage
+        save_criteria("same", {'spaces': 'AWS'})
+
+        with patch('storage._write_presets', wraps=storage._write_presets) as mock_write:
+            assert save_criteria("same", {'spaces': 'AWS'}) == True
+            assert mock_write.call_count == 0
+            save_criteria("same", {'spaces': 'CLOUD'})
+            assert mock_write.call_count == 1
+
+        assert load_criteria("same") == {'spaces': 'CLOUD'}
+
     def test_load_nonexistent_preset(self):
         """Test loading preset that doesn't exist"""
         result = load_criteria("nonexistent_preset_xyz")
@@ -344,6 +372,23 @@ class TestAuthentication:
         mock_jira_class.assert_called_once()
         mock_jira.myself.assert_called_once()
     
+    @patch('auth.Jira')
+    def test_get_jira_client_cached(self, mock_jira_class):
+        """Test the Jira client is built and verified once per credential set"""
+        from auth import get_jira_client
+        
+        mock_jira = Mock()
+        mock_jira.myself.return_value = {'displayName': 'Test User'}
+        mock_jira_class.return_value = mock_jira
+        
+        first = get_jira_client("https://cached.atlassian.net", "test@example.com", "test_token")
+        second = get_jira_client("https://cached.atlassian.net", "test@example.com", "test_token")
+        
+        assert first is second
+        mock_jira_class.assert_called_once()
+        mock_jira.myself.assert_called_once()
+        get_jira_client.clear()
+    
     @patch('auth.Jira')
     def test_validate_jira_credentials_success(self, mock_jira_class):
         """Test successful credential validation"""
@@ -386,6 +431,20 @@ class TestAuthentication:
 class TestJiraClient:
     """Test Jira API interactions"""
     
+    def test_client_construction_makes_no_requests(self):
+        """Test version detection is deferred until it is needed"""
+        from jira_core import JiraClient
+        
+        mock_jira = Mock()
+        mock_jira.get.return_value = {'deploymentType': 'Cloud'}
+        
+        client = JiraClient(mock_jira)
+        mock_jira.get.assert_not_called()
+        
+        assert client.jira_type == "Cloud"
+        assert client.jira_type == "Cloud"
+        mock_jira.get.assert_called_once_with('rest/api/2/serverInfo')
+    
     def test_fetch_issues_single_page(self):
         """Test fetching issues with single page"""
         from jira_core import JiraClient
@@ -436,7 +495,145 @@ class TestJiraClient:
         issues = client.fetch_issues("project = AWS")
         
         assert len(issues) == 75
-    
+
+    def test_iter_issue_pages_yields_each_page(self):
+        """Test pages are yielded in order and paging follows server caps"""
+        from jira_core import JiraClient
+
+        def page(jql, fields=None, start=0, limit=500):
+            keys = range(start, min(start + min(limit, 40), 100))
+            return {'issues': [{'key': f'AWS-{i}'} for i in keys], 'total': 100}
+
+        mock_jira = Mock()
+        mock_jira.jql.side_effect = page
+
+        pages = list(JiraClient(mock_jira).iter_issue_pages("project = AWS"))
+
+        assert [len(p) for p in pages] == [40, 40, 20]
+        assert [c.kwargs['start'] for c in mock_jira.jql.call_args_list] == [0, 40, 80]
+
+    def test_fetch_issues_requests_report_fields_only(self):
+        """Test searches ask Jira for the report's fields, not every field"""
+        from jira_core import JiraClient, ISSUE_FIELDS
+
+        mock_jira = Mock()
+        mock_jira.jql.return_value = {'issues': [], 'total': 0}
+
+        JiraClient(mock_jira).fetch_issues("project = AWS")
+
+        assert mock_jira.jql.call_args.kwargs['fields'] == ISSUE_FIELDS
+        assert 'summary' in ISSUE_FIELDS and 'subtasks' in ISSUE_FIELDS
+
+    def test_fetch_issues_parallel_keeps_page_order(self):
+        """Test parallel pagination fetches every page and preserves order"""
+        from jira_core import JiraClient
+
+        def page(jql, fields=None, start=0, limit=100):
+            keys = range(start, min(start + limit, 250))
+            return {'issues': [{'key': f'AWS-{i}'} for i in keys],
+                    'total': 250, 'maxResults': limit, 'startAt': start}
+
+        mock_jira = Mock()
+        mock_jira.jql.side_effect = page
+
+        client = JiraClient(mock_jira)
+        issues = client.fetch_issues_parallel("project = AWS", page_size=100)
+
+        assert [i['key'] for i in issues] == [f'AWS-{i}' for i in range(250)]
+        assert mock_jira.jql.call_count == 3
+
+    def test_fetch_issues_parallel_retries_failed_page(self):
+        """Test a page that fails once is retried without losing the others"""
+        from jira_core import JiraClient
+
+        failed = []
+
+        def page(jql, fields=None, start=0, limit=100):
+            if start == 100 and not failed:
+                failed.append(start)
+                raise ConnectionError("reset by peer")
+            keys = range(start, min(start + limit, 250))
+            return {'issues': [{'key': f'AWS-{i}'} for i in keys],
+                    'total': 250, 'maxResults': limit, 'startAt': start}
+
+        mock_jira = Mock()
+        mock_jira.jql.side_effect = page
+
+        issues = JiraClient(mock_jira).fetch_issues_parallel("project = AWS", page_size=100)
+
+        assert [i['key'] for i in issues] == [f'AWS-{i}' for i in range(250)]
+        assert mock_jira.jql.call_count == 4
+
+    def test_fetch_issues_parallel_without_total_reuses_first_page(self):
+        """Test a response with no total (Cloud enhanced search) is not refetched"""
+        from jira_core import JiraClient
+
+        mock_jira = Mock()
+        mock_jira.jql.return_value = {'issues': [{'key': 'AWS-1'}, {'key': 'AWS-2'}],
+                                      'isLast': True}
+
+        issues = JiraClient(mock_jira).fetch_issues_parallel("project = AWS", page_size=500)
+
+        assert [i['key'] for i in issues] == ['AWS-1', 'AWS-2']
+        assert mock_jira.jql.call_count == 1
+        assert mock_jira.jql.call_args.kwargs['limit'] == 500
+
+    def test_fetch_issues_follows_next_page_token_without_total(self):
+        """Test Cloud enhanced search pages (no total) are followed to isLast"""
+        from jira_core import JiraClient
+
+        mock_jira = Mock()
+        mock_jira.jql.return_value = {'issues': [{'key': f'AWS-{i}'} for i in range(100)],
+                                      'isLast': False, 'nextPageToken': 'tok-2'}
+        mock_jira.enhanced_jql.return_value = {'issues': [{'key': f'AWS-{i}'} for i in range(100, 130)],
+                                               'isLast': True}
+
+        issues = JiraClient(mock_jira).fetch_issues("project = AWS", batch_size=100)
+
+        assert [i['key'] for i in issues] == [f'AWS-{i}' for i in range(130)]
+        assert mock_jira.jql.call_count == 1
+        assert mock_jira.enhanced_jql.call_args.kwargs['nextPageToken'] == 'tok-2'
+
+    def test_fetch_issues_parallel_follows_next_page_token_without_total(self):
+        """Test the no-total fallback keeps paging by token instead of truncating"""
+        from jira_core import JiraClient
+
+        pages = {
+            'tok-2': {'issues': [{'key': f'AWS-{i}'} for i in range(100, 200)],
+                      'isLast': False, 'nextPageToken': 'tok-3'},
+            'tok-3': {'issues': [{'key': f'AWS-{i}'} for i in range(200, 250)],
+                      'isLast': True},
+        }
+        mock_jira = Mock()
+        mock_jira.jql.return_value = {'issues': [{'key': f'AWS-{i}'} for i in range(100)],
+                                      'isLast': False, 'nextPageToken': 'tok-2'}
+        mock_jira.enhanced_jql.side_effect = lambda jql, fields=None, nextPageToken=None, limit=None: \
+            pages[nextPageToken]
+
+        issues = JiraClient(mock_jira).fetch_issues_parallel("project = AWS", page_size=100)
+
+        assert [i['key'] for i in issues] == [f'AWS-{i}' for i in range(250)]
+        assert mock_jira.jql.call_count == 1
+        assert mock_jira.enhanced_jql.call_count == 2
+
+    def test_standalone_fetch_issues_concurrent_windows(self):
+        """Test standalone fetch_issues honours batch_size and max_workers"""
+        from jira_core import fetch_issues
+
+        def page(jql, fields=None, start=0, limit=100):
+            keys = range(start, min(start + limit, 95))
+            return {'issues': [{'key': f'AWS-{i}'} for i in keys],
+                    'total': 95, 'maxResults': limit, 'startAt': start}
+
+        mock_jira = Mock(url='https://example.atlassian.net')
+        mock_jira.jql.side_effect = page
+
+        issues = fetch_issues(mock_jira, "project = AWS", batch_size=20, max_workers=3)
+
+        assert [i['key'] for i in issues] == [f'AWS-{i}' for i in range(95)]
+        starts = sorted(c.kwargs['start'] for c in mock_jira.jql.call_args_list)
+        assert starts == [0, 20, 40, 60, 80]
+
     def test_get_epic_context(self):
         """Test fetching epic context"""
         from jira_core import JiraClient
@@ -472,7 +669,36 @@ class TestJiraClient:
         
         assert 'No summary' in context['summary']
         assert 'No description' in context['description']
-    
+
+    def test_get_epic_context_cached_but_failures_are_not(self):
+        """Test standalone epic lookup is cached per URL and key, errors retried"""
+        from jira_core import get_epic_context
+
+        mock_jira = Mock(url='https://epic-cache.atlassian.net')
+        mock_jira.issue.side_effect = [
+            Exception("timeout"),
+            {'fields': {'summary': 'Epic Summary', 'description': 'Epic Description'}}
+        ]
+
+        assert get_epic_context(mock_jira, "AWS-200")['summary'] == 'Unable to fetch epic'
+        assert get_epic_context(mock_jira, "AWS-200")['summary'] == 'Epic Summary'
+        assert get_epic_context(mock_jira, "AWS-200")['summary'] == 'Epic Summary'
+        assert mock_jira.issue.call_count == 2
+
+    def test_get_epic_context_cache_is_per_account(self):
+        """Test one account's cached epic is not served to another account"""
+        from jira_core import get_epic_context
+
+        url = 'https://epic-accounts.atlassian.net'
+        alice = Mock(url=url, username='alice@example.com')
+        alice.issue.return_value = {'fields': {'summary': 'Secret Epic', 'description': ''}}
+        bob = Mock(url=url, username='bob@example.com')
+        bob.issue.side_effect = Exception("404: issue does not exist or no permission")
+
+        assert get_epic_context(alice, "AWS-300")['summary'] == 'Secret Epic'
+        assert get_epic_context(bob, "AWS-300")['summary'] == 'Unable to fetch epic'
+        assert bob.issue.call_count == 1
+
     def test_discover_projects_api_v3(self):
         """Test project discovery using API v3"""
         from jira_core import JiraClient
@@ -514,6 +740,137 @@ class TestJiraClient:
         assert any(p['key'] == 'AWS' for p in projects)
 
 
+    def test_discover_projects_cloud_single_call(self):
+        """Test Cloud discovery goes straight to the v3 search endpoint"""
+        from jira_core import discover_projects
+        
+        mock_jira = Mock()
+        mock_jira.get.return_value = {
+            'values': [{'key': 'AWS', 'name': 'AWS Migration'}]
+        }
+        
+        projects, source = discover_projects(mock_jira, is_cloud=True)
+        
+        assert projects == {'AWS': 'AWS Migration'}
+        assert source == 'API v3'
+        mock_jira.get.assert_called_once_with(
+            'rest/api/3/project/search', params={'startAt': 0, 'maxResults': 50}
+        )
+        mock_jira.jql.assert_not_called()
+
+    def test_discover_projects_cloud_follows_pages(self):
+        """Test Cloud discovery walks project/search pages until isLast"""
+        from jira_core import discover_projects
+        
+        mock_jira = Mock()
+        mock_jira.get.side_effect = [
+            {'values': [{'key': 'AWS', 'name': 'AWS Migration'}], 'isLast': False},
+            {'values': [{'key': 'OPS', 'name': 'Operations'}], 'isLast': True}
+        ]
+        
+        projects, source = discover_projects(mock_jira, is_cloud=True)
+        
+        assert projects == {'AWS': 'AWS Migration', 'OPS': 'Operations'}
+        assert mock_jira.get.call_args_list[1].kwargs['params']['startAt'] == 1
+
+    def test_discover_projects_cloud_fetches_remaining_pages_concurrently(self):
+        """Test Cloud discovery plans remaining pages from the reported total"""
+        from jira_core import discover_projects
+        
+        def page(endpoint, params):
+            start = params['startAt']
+            keys = range(start, min(start + 50, 120))
+            return {'values': [{'key': f'P{i}', 'name': f'Project {i}'} for i in keys],
+                    'total': 120, 'maxResults': 50, 'isLast': start + 50 >= 120}
+        
+        mock_jira = Mock()
+        mock_jira.get.side_effect = page
+        
+        projects, source = discover_projects(mock_jira, is_cloud=True)
+        
+        assert list(projects) == [f'P{i}' for i in range(120)]
+        assert mock_jira.get.call_count == 3
+    
+    def test_discover_projects_http_error_falls_back_to_jql(self):
+        """Test JQL fallback only runs when the endpoint returns an HTTP error"""
+        import requests
+        from jira_core import discover_projects
+        
+        mock_jira = Mock()
+        mock_jira.get.side_effect = requests.exceptions.HTTPError("404")
+        mock_jira.jql.return_value = {
+            'issues': [{'fields': {'project': {'key': 'OPS', 'name': 'Operations'}}}]
+        }
+        
+        projects, source = discover_projects(mock_jira, is_cloud=False)
+        
+        assert projects == {'OPS': 'Operations'}
+        assert source == 'from your issues'
+        mock_jira.get.assert_called_once_with('rest/api/2/project')
+
+    def test_issues_to_dataframe(self):
+        """Test raw issues flatten into the report table"""
+        from jira_core import issues_to_dataframe
+
+        issues = [
+            {'key': 'AWS-1', 'fields': {'summary': 'Epic', 'status': {'name': 'Done'},
+                                        'subtasks': [{'key': 'AWS-2'}]}},
+            {'key': 'AWS-2', 'fields': {'summary': 'Child', 'parent': {'key': 'AWS-1'},
+                                        'assignee': {'displayName': 'Dana'}}}
+        ]
+
+        df = issues_to_dataframe(issues)
+
+        assert df['Key'].tolist() == ['AWS-1', 'AWS-2']
+        assert df['Status'].tolist() == ['Done', 'N/A']
+        assert df['Assignee'].tolist() == ['Unassigned', 'Dana']
+        assert df.loc[0, 'Subtasks'] == ['AWS-2']
+        assert df.loc[1, 'Parent'] == 'AWS-1'
+        assert isinstance(df['Status'].dtype, pd.CategoricalDtype)
+
+    @patch('jira_core.get_epic_context', return_value={'summary': 'Epic', 'description': ''})
+    @patch('jira_core.iter_issues', return_value=[])
+    def test_generate_report_counts_prior_progress(self, mock_fetch, mock_epic):
+        """Test prior progress and overdue counts use parsed dates"""
+        from jira_core import generate_report
+
+        issues = [
+            {'key': 'AWS-1', 'fields': {'summary': 'Old', 'status': {'name': 'Done'},
+                                        'resolutiondate': '2020-01-02T00:00:00.000+0000'}},
+            {'key': 'AWS-2', 'fields': {'summary': 'Bad date', 'status': {'name': 'Done'},
+                                        'resolutiondate': 'not-a-date'}},
+            {'key': 'AWS-3', 'fields': {'summary': 'Future', 'status': {'name': 'Done'},
+                                        'resolutiondate': '2099-01-01T00:00:00.000+0000'}},
+            {'key': 'AWS-4', 'fields': {'summary': 'Late', 'status': {'name': 'In Progress'},
+                                        'duedate': '2000-01-01'}},
+            {'key': 'AWS-5', 'fields': {'summary': 'On track', 'status': {'name': 'In Progress'},
+                                        'duedate': '2999-01-01'}}
+        ]
+
+        report, _, _ = generate_report(issues, 'team_lead', 'None', None, 'Init',
+                                       '2020-01-01 to 2030-01-01', Mock(url=''), 'AWS', None)
+
+        assert '1 items completed prior to this period.' in report
+        assert 'Overdue: 1' in report
+
+    @patch('jira_core.get_epic_context', return_value={'summary': 'Epic', 'description': ''})
+    @patch('jira_core.iter_issues')
+    def test_generate_report_uses_prefetched_next_issues(self, mock_iter, mock_epic):
+        """Test pre-fetched next-period issues skip the next-steps query"""
+        from jira_core import generate_report
+
+        issues = [{'key': 'AWS-1', 'fields': {'summary': 'Done', 'status': {'name': 'Done'}}}]
+        next_issues = [{'key': 'AWS-9', 'fields': {'summary': 'Upcoming', 'status': {'name': 'To Do'},
+                                                   'priority': {'name': 'High'}}}]
+
+        report, _, next_df = generate_report(issues, 'team_lead', 'None', None, 'Init', 'last_week',
+                                             Mock(url=''), 'AWS', None, next_issues=next_issues)
+
+        mock_iter.assert_not_called()
+        assert next_df['Key'].tolist() == ['AWS-9']
+        assert 'AWS-9: Upcoming' in report
+
+
 # ============================================================================
 # TEST: llm_integrations.py - LLM Providers (Mocked)
 # ============================================================================
@@ -521,7 +878,7 @@ class TestJiraClient:
 class TestLLMIntegrations:
     """Test LLM provider integrations"""
     
-    @patch('llm_integrations.requests.get')
+    @patch('llm_integrations._HTTP.get')
     def test_fetch_groq_models(self, mock_get):
         """Test fetching Groq models dynamically"""
         from llm_integrations import fetch_groq_models
@@ -541,8 +898,21 @@ class TestLLMIntegrations:
         assert len(models) == 2
         assert 'llama-3.3-70b-versatile' in models
         assert 'mixtral-8x7b-32768' in models
-    
-    @patch('llm_integrations.requests.post')
+
+    @patch('llm_integrations._HTTP.get')
+    def test_fetch_groq_models_failure_not_cached(self, mock_get):
+        """Test a failed model fetch is retried on the next call"""
+        from llm_integrations import fetch_groq_models
+
+        mock_response = Mock()
+        mock_response.json.return_value = {'data': [{'id': 'llama-3.3-70b-versatile'}]}
+        mock_response.raise_for_status = Mock()
+        mock_get.side_effect = [Exception("Connection reset"), mock_response]
+
+        assert fetch_groq_models("flaky_api_key") == []
+        assert fetch_groq_models("flaky_api_key") == ['llama-3.3-70b-versatile']
+
+    @patch('llm_integrations._HTTP.post')
     def test_call_groq_llm_success(self, mock_post):
         """Test successful Groq API call"""
         from llm_integrations import call_groq_llm
@@ -566,7 +936,7 @@ class TestLLMIntegrations:
         assert summary == 'Test summary'
         assert rate_limited == False
     
-    @patch('llm_integrations.requests.post')
+    @patch('llm_integrations._HTTP.post')
     def test_call_groq_llm_rate_limited(self, mock_post):
         """Test Groq API rate limit handling"""
         from llm_integrations import call_groq_llm
@@ -584,6 +954,71 @@ class TestLLMIntegrations:
         assert summary == ""
         assert rate_limited == True
 
+    @patch('llm_integrations.call_groq_llm')
+    def test_llm_summary_cached_but_errors_are_not(self, mock_call):
+        """Test identical prompts reuse the summary while failures retry"""
+        from llm_integrations import get_llm_summary
+
+        mock_call.return_value = ("Shipped v2", False)
+        first = get_llm_summary("Groq (Free Tier)", "key", "cache test prompt", "model-a")
+        second = get_llm_summary("Groq (Free Tier)", "key", "cache test prompt", "model-a")
+        assert first == second == "Shipped v2"
+        assert mock_call.call_count == 1
+
+        mock_call.return_value = ("", True)
+        get_llm_summary("Groq (Free Tier)", "key", "rate limited prompt", "model-a")
+        get_llm_summary("Groq (Free Tier)", "key", "rate limited prompt", "model-a")
+        assert mock_call.call_count == 3
+
+    @patch('llm_integrations.call_groq_llm')
+    def test_llm_summary_cache_is_per_api_key(self, mock_call):
+        """Test a summary paid for by one API key is not served to another"""
+        from llm_integrations import get_llm_summary
+
+        mock_call.return_value = ("Shipped v2", False)
+        get_llm_summary("Groq (Free Tier)", "key-a", "per key prompt", "model-a")
+
+        mock_call.return_value = ("❌ Error: 401 Unauthorized", False)
+        other = get_llm_summary("Groq (Free Tier)", "key-b", "per key prompt", "model-a")
+        assert other == "❌ Error: 401 Unauthorized"
+        assert mock_call.call_count == 2
+
+    @patch('llm_integrations.call_groq_llm')
+    def test_llm_summary_refresh_skips_cache(self, mock_call):
+        """Test refresh=True asks for a new summary and caches it"""
+        from llm_integrations import get_llm_summary
+
+        mock_call.return_value = ("First take", False)
+        get_llm_summary("Groq (Free Tier)", "key", "refresh test prompt", "model-a")
+
+        mock_call.return_value = ("Second take", False)
+        fresh = get_llm_summary("Groq (Free Tier)", "key", "refresh test prompt", "model-a", refresh=True)
+        again = get_llm_summary("Groq (Free Tier)", "key", "refresh test prompt", "model-a")
+        assert fresh == again == "Second take"
+        assert mock_call.call_count == 2
+
+    @patch('llm_integrations._HTTP.post')
+    def test_stream_groq_llm_yields_deltas(self, mock_post):
+        """Test Groq streaming yields content deltas until [DONE]"""
+        from llm_integrations import stream_groq_llm
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b'',
+            b'data: {"choices": [{"delta": {"content": "Shipped "}}]}',
+            b'data: {"choices": [{"delta": {"content": "v2"}}]}',
+            b'data: [DONE]'
+        ]
+        mock_post.return_value = mock_response
+
+        chunks = list(stream_groq_llm("Test prompt", "llama-3.3-70b-versatile", "test_api_key"))
+
+        assert chunks == ["Shipped ", "v2"]
+        assert mock_post.call_args.kwargs['json']['stream'] is True
+        mock_response.close.assert_called_once()
+
 
 # ============================================================================
 # TEST: Edge Cases and Error Handling